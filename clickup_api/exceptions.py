@@ -7,6 +7,8 @@ DATE_DATA_ERROR = "Invalid date. Use datetime.datetime() format or enter datetim
 TIME_DURATION_ERROR = "Invalid time duration. Time duration has to be a list/tuple of three elements: \
     days, hours and minutes. To ommit any of those elements, type 0 \
     (eg: [0, 1, 0] for one hour duration)."
+CIRCUIT_OPEN_ERROR = "Requests to '{}' are suspended after repeated failures. \
+    Try again in {:.0f} seconds."
 
 
 class DateSequenceError(Exception):
@@ -49,3 +51,15 @@ class TimeDurationError(Exception):
 
     def __str__(self) -> str:
         return str(self.message)
+
+
+class CircuitOpenError(Exception):
+    """Exception raised when requests to a failing host are short-circuited."""
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        self.host = host
+        self.retry_in = retry_in
+        self.message = CIRCUIT_OPEN_ERROR.format(host, retry_in)
+
+    def __str__(self) -> str:
+        return str(self.message)
@@ -1,4 +1,5 @@
 import datetime
+import functools
 import random
 import string
 from urllib.parse import urlparse
@@ -48,15 +49,31 @@ def check_boolean(value: bool) -> bool:
     return value
 
 
+@functools.lru_cache(maxsize=256)
+def _date_sequence_to_unix_time_in_milliseconds(date: tuple[int]) -> int:
+    """Converts a tuple of (year, month, day[, hour, minute, second]) integers to unix
+    time in milliseconds. Cached, as the same filter dates are converted for each
+    request (e.g. for each page of tasks)."""
+    try:
+        return int(datetime.datetime(*date).timestamp() * 1000)
+    except ValueError as error:
+        raise DateSequenceError(error)
+
+
 def datetime_to_unix_time_in_milliseconds(
-    date: datetime.datetime | list[int] | tuple[int],
+    date: datetime.datetime | list[int] | tuple[int] | int,
 ) -> int:
     """Converts datetime.date or date represented by the list of [year, month, day] or
-    a tuple of (year, month, day) to unix time in milliseconds."""
+    a tuple of (year, month, day) to unix time in milliseconds. Integers are treated
+    as already converted and returned unchanged."""
     if date:
+        if isinstance(date, int) and not isinstance(date, bool):
+            return date
         if isinstance(date, datetime.datetime):
             date = int(date.timestamp() * 1000)
         elif isinstance(date, (list, tuple)) and len(date) >= 3 and len(date) <= 6:
+            if all(type(component) is int for component in date):
+                return _date_sequence_to_unix_time_in_milliseconds(tuple(date))
             try:
                 date = int(datetime.datetime(*date).timestamp() * 1000)
             except ValueError as error:
@@ -80,6 +97,13 @@ def date_as_string_to_unix_time_in_milliseconds(date: str) -> int:
     return date
 
 
+def convert_date_strings(dates: dict[str, str | None]) -> dict[str, int | None]:
+    """Converts each date string in a dictionary to unix time in milliseconds
+    (see date_as_string_to_unix_time_in_milliseconds). Empty values become None."""
+    convert = date_as_string_to_unix_time_in_milliseconds
+    return {key: convert(value) if value else None for key, value in dates.items()}
+
+
 def date_as_dict_to_unix_time_in_milliseconds(date: dict) -> int:
     """Converts date expressed as a dictionaty of year, month, day to unix time
     in milliseconds."""
@@ -140,6 +164,20 @@ def time_as_dict_to_unix_time_in_milliseconds(time: dict) -> int:
     return time
 
 
+@functools.lru_cache(maxsize=1024)
+def unix_time_in_milliseconds_to_duration(milliseconds: int) -> str:
+    """Converts duration in milliseconds to a string in the same format as
+    str(datetime.timedelta) without microseconds, e.g. '1 day, 2:05:00'.
+    Results are cached, as many tasks share the same duration."""
+    hours, remainder = divmod(int(milliseconds) // 1000, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    days, hours = divmod(hours, 24)
+    duration = f"{hours}:{minutes:02d}:{seconds:02d}"
+    if days:
+        return f"{days} day{'s' if abs(days) != 1 else ''}, {duration}"
+    return duration
+
+
 def check_and_adjust_list_length(data: list, append_number: bool = False) -> list:
     """Validates if type of data is a list. If a list contains only one element,
     appends either random string or random number.
@@ -6,13 +6,16 @@ from unittest.mock import patch
 from dotenv import load_dotenv
 from parameterized import parameterized
 
-from clickup_api.exceptions import DateSequenceError, DateValueError
-from clickup_api.handlers import (check_and_adjust_list_length, check_boolean,
+from clickup_api.exceptions import (DateSequenceError, DateTypeError,
+                                    DateValueError)
+from clickup_api.handlers import (_date_sequence_to_unix_time_in_milliseconds,
+                                  check_and_adjust_list_length, check_boolean,
                                   check_integer_list, check_positive_integer,
-                                  check_token,
+                                  check_token, convert_date_strings,
                                   date_as_string_to_unix_time_in_milliseconds,
                                   datetime_to_unix_time_in_milliseconds,
-                                  is_url, split_int_array, split_string_array)
+                                  is_url, split_int_array, split_string_array,
+                                  unix_time_in_milliseconds_to_duration)
 
 load_dotenv()
 
@@ -102,6 +105,7 @@ class TestHandlers(unittest.TestCase):
             ),
             ("test list format", [2024, 10, 10], 1728511200000.0),
             ("test tuple format", (2024, 7, 7, 7, 55), 1720331700000.0),
+            ("test unix time format", 1720331700000, 1720331700000),
         ]
     )
     def test_datetime_to_unix_time_in_milliseconds_success(
@@ -109,11 +113,20 @@ class TestHandlers(unittest.TestCase):
     ):
         self.assertEqual(datetime_to_unix_time_in_milliseconds(value), expected)
 
+    def test_datetime_to_unix_time_in_milliseconds_caches_date_sequences(self):
+        convert = _date_sequence_to_unix_time_in_milliseconds
+        convert.cache_clear()
+        first = datetime_to_unix_time_in_milliseconds([1999, 1, 2, 3])
+        second = datetime_to_unix_time_in_milliseconds((1999, 1, 2, 3))
+        self.assertEqual(first, second)
+        self.assertEqual(convert.cache_info().hits, 1)
+
     @parameterized.expand(
         [
             ("incorrect list format", [10, 10, 2024], DateSequenceError),
             ("incorrect tuple format", (7, 7, 2024), DateSequenceError),
             ("incorrect data type", "2024, 11, 11", DateValueError),
+            ("incorrect component type", [2024, "11", 11], DateTypeError),
         ]
     )
     def test_datetime_to_unix_time_in_milliseconds_raises_error(
@@ -122,6 +135,23 @@ class TestHandlers(unittest.TestCase):
         with self.assertRaises(error):
             self.assertEqual(datetime_to_unix_time_in_milliseconds(value))
 
+    @parameterized.expand(
+        [
+            ("exact seconds", 5400000),
+            ("truncated milliseconds", 61999),
+            ("more than one day", 93784000),
+            ("more than two days", 200000000),
+            ("negative duration", -60500),
+        ]
+    )
+    def test_unix_time_in_milliseconds_to_duration_matches_timedelta(
+        self, name: str, milliseconds: int
+    ):
+        self.assertEqual(
+            unix_time_in_milliseconds_to_duration(milliseconds),
+            str(datetime.timedelta(seconds=milliseconds / 1000)).split(".")[0],
+        )
+
     @parameterized.expand(
         [
             ("test list format", "2024, 10, 10", 1728511200000.0),
@@ -149,6 +179,11 @@ class TestHandlers(unittest.TestCase):
         with self.assertRaises(error):
             self.assertEqual(date_as_string_to_unix_time_in_milliseconds(value))
 
+    def test_convert_date_strings_success(self):
+        dates = {"due_date_gt": "2024, 10, 10", "due_date_lt": None, "start": ""}
+        expected = {"due_date_gt": 1728511200000, "due_date_lt": None, "start": None}
+        self.assertEqual(convert_date_strings(dates), expected)
+
     @parameterized.expand(
         [
             ("empty list", False, [], []),
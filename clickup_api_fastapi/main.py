@@ -1,9 +1,10 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from .routers import (additional_methods, delete_methods, get_methods,
                       post_put_methods)
 
-app = FastAPI(title="ClickUp API Methods")
+app = FastAPI(title="ClickUp API Methods", default_response_class=ORJSONResponse)
 
 app.include_router(additional_methods.router)
 app.include_router(get_methods.router)
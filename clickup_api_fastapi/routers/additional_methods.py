@@ -1,21 +1,42 @@
-import datetime
+import asyncio
+import copy
+import logging
+import time
+from collections import defaultdict
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Body, HTTPException, Query, Response
-from fastapi.encoders import jsonable_encoder
-from pydantic import BaseModel
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response
+from pydantic import BaseModel, ConfigDict
 from starlette import status
 
-from clickup_api.handlers import split_int_array
+from clickup_api.handlers import (split_int_array,
+                                  unix_time_in_milliseconds_to_duration)
 from clickup_api_fastapi.routers.get_methods import (
-    get_authorized_teams_workspaces, get_task, get_time_entries)
+    get_authorized_teams_workspaces, get_task, time_entries_json)
 
-from ..utils import validate_token
+from ..utils import response_json, validate_token
 from .post_put_methods import (CreateChecklist, CreateChecklistItem,
                                CreateTaskFullRequest, create_checklist,
                                create_checklist_item, create_task)
 
-router = APIRouter(tags=["ClickUp additional (mixed) methods"], prefix="/additional")
+logger = logging.getLogger(__name__)
+
+# concurrent get_time_entries requests, capped to respect ClickUp rate limits:
+TIME_ENTRIES_CONCURRENCY = 8
+# get_authorized_teams_workspaces responses cached per token:
+TEAMS_WORKSPACES_TTL = 60  # seconds
+TEAMS_WORKSPACES_CACHE_SIZE = 16
+_teams_workspaces_cache: dict[str | None, tuple[float, dict]] = {}
+_teams_workspaces_locks: dict[str | None, asyncio.Lock] = {}
+# allowed (task_id, checklist_id, checklist_name) combinations for adding
+# checklist items - to a new checklist or to existing one:
+_CHECKLIST_MODES = {(True, False, True): "new", (False, True, False): "existing"}
+
+router = APIRouter(
+    tags=["ClickUp additional (mixed) methods"],
+    prefix="/additional",
+    dependencies=[Depends(validate_token)],
+)
 
 
 class Checklists(CreateChecklist):
@@ -23,13 +44,53 @@ class Checklists(CreateChecklist):
 
 
 class Task(BaseModel):
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     task: CreateTaskFullRequest
     checklists: list[Checklists]
 
 
+async def cached_teams_workspaces(token: str | None = None) -> dict:
+    """
+    Returns get_authorized_teams_workspaces response, cached per token for
+    TEAMS_WORKSPACES_TTL seconds. Concurrent calls for the same token share
+    a single request.
+
+    Args:
+        token (str | None, optional):
+            Token for request authentication. If None, uses token of an instance.
+            Defaults to None.
+    Returns:
+        dict:
+            Returns a copy of teams (workspaces) authorized for a token owner,
+            safe to modify.
+    """
+
+    cached = _teams_workspaces_cache.get(token)
+    if cached and cached[0] > time.monotonic():
+        return copy.deepcopy(cached[1])
+
+    # calls waiting on the lock reuse the response of a call in progress:
+    async with _teams_workspaces_locks.setdefault(token, asyncio.Lock()):
+        cached = _teams_workspaces_cache.get(token)
+        if cached and cached[0] > time.monotonic():
+            return copy.deepcopy(cached[1])
+
+        workspaces = response_json(await get_authorized_teams_workspaces(token))
+        _teams_workspaces_cache.pop(token, None)
+        if len(_teams_workspaces_cache) >= TEAMS_WORKSPACES_CACHE_SIZE:
+            # dropping the oldest entry:
+            _teams_workspaces_cache.pop(next(iter(_teams_workspaces_cache)))
+        _teams_workspaces_cache[token] = (
+            time.monotonic() + TEAMS_WORKSPACES_TTL,
+            copy.deepcopy(workspaces),
+        )
+    return workspaces
+
+
 async def request_workspace_ids(
     team_id: Any | None = None, token: str | None = None
-) -> list | tuple:
+) -> list:
     """
     If no 'team_id' - returns a list of workspaces (team_ids) authorized for a token
     owner from get_authorized_teams_workspaces request.
@@ -43,30 +104,24 @@ async def request_workspace_ids(
             Token for request authentication. If None, uses token of an instance.
             Defaults to None.
     Returns:
-        list | tuple:
-            Returns a list or a tuple of team_ids (workspaces).
+        list:
+            Returns a list of team_ids (workspaces).
     """
 
-    validate_token(token)
-
-    if not team_id:
-        workspaces = await get_authorized_teams_workspaces(token)
-        if not workspaces["teams"]:
+    if team_id is None:
+        teams_data = (await cached_teams_workspaces(token)).get("teams")
+        if not teams_data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=("No teams (workspaces) found for a given token."),
             )
-        teams = []
-        for team in workspaces["teams"]:
-            teams.append(team["id"])
-    elif isinstance(team_id, (list, tuple)):
-        teams = team_id
-    else:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"'team_id' must be a list or a tuple, not {type(team_id)}.",
-        )
-    return teams
+        return [team["id"] for team in teams_data]
+    if isinstance(team_id, (list, tuple)):
+        return list(team_id)
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"'team_id' must be a list or a tuple, not {type(team_id)}.",
+    )
 
 
 async def request_time_entries_for_workspace_ids(
@@ -74,6 +129,8 @@ async def request_time_entries_for_workspace_ids(
 ) -> list:
     """
     Returns a list of responses from get_time_entries request on each team (workspace).
+    Requests for all teams are sent concurrently, at most TIME_ENTRIES_CONCURRENCY
+    at a time.
 
     Args:
         team_id (list[int] | tuple[int]):
@@ -89,40 +146,39 @@ async def request_time_entries_for_workspace_ids(
             detail="'team_id' must be a list or a tuple with ID values.",
         )
 
-    responses = []
-    for team in team_id:
-        response = await get_time_entries(team_id=team, **kwargs)
-        if not "data" in response.keys():
+    semaphore = asyncio.Semaphore(TIME_ENTRIES_CONCURRENCY)
+
+    async def request_time_entries(team: int) -> dict:
+        async with semaphore:
+            return await time_entries_json(team_id=team, **kwargs)
+
+    responses = await asyncio.gather(*(request_time_entries(team) for team in team_id))
+    for response in responses:
+        if "data" not in response:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail=f"Team not authorized for a given token user. "
                 "Change 'team_id' parameter or upgrade token value.",
             )
-        else:
-            responses.append(response)
     return responses
 
 
 async def request_assignee_by_username(username: str, token: str | None) -> int:
-    workspaces_data = await get_authorized_teams_workspaces(token)
-    for team in workspaces_data["teams"]:
-        is_user_in_workspace = False
-        for user in team["members"]:
-            if username.casefold() == user["user"]["username"].casefold():
-                assignee = user["user"][
-                    "id"
-                ]  # getting user_id from username from workspace
-                is_user_in_workspace = True
-                break
-
-    if not is_user_in_workspace:
+    workspaces_data = await cached_teams_workspaces(token)
+    user_ids = {
+        member["user"]["username"].casefold(): member["user"]["id"]
+        for team in workspaces_data["teams"]
+        for member in team["members"]
+    }
+    assignee = user_ids.get(username.casefold())
+
+    if assignee is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User '{username}' not found in workspace list of members.  "
             "Validate 'username' argument or use another token to search "
             "through different workspaces.",
         )
-    print(assignee)
     return assignee
 
 
@@ -152,10 +208,7 @@ async def user_worktime(
     only_billable: bool = False,
     token: str | None = None,
 ) -> dict:
-
-    validate_token(token)
-
-    workspaces = await request_workspace_ids(team_id=team_id)
+    workspaces = await request_workspace_ids(team_id=team_id, token=token)
 
     time_entry_responses = await request_time_entries_for_workspace_ids(
         workspaces,
@@ -165,30 +218,25 @@ async def user_worktime(
         token=token,
     )
 
-    duration_per_user = {}
-    for response in time_entry_responses:
-        for task in response["data"]:
-            if task["user"]["username"] in duration_per_user:
-                if only_billable:
-                    duration_per_user[task["user"]["username"]] += (
-                        int(task["duration"]) if task["billable"] else 0
-                    )
-                else:
-                    duration_per_user[task["user"]["username"]] += int(task["duration"])
-            else:
-                if only_billable:
-                    duration_per_user[task["user"]["username"]] = (
-                        int(task["duration"]) if task["billable"] else 0
-                    )
+    duration_per_user: defaultdict[str, int] = defaultdict(int)
+    if only_billable:
+        for response in time_entry_responses:
+            for task in response["data"]:
+                username = task["user"]["username"]
+                if task["billable"]:
+                    duration_per_user[username] += int(task["duration"])
                 else:
-                    duration_per_user[task["user"]["username"]] = int(task["duration"])
-
-    for user, duration in duration_per_user.items():
-        duration_per_user[user] = str(
-            datetime.timedelta(seconds=int(duration) / 1000)
-        ).split(".")[0]
+                    # user is still listed, with no billable time:
+                    duration_per_user.setdefault(username, 0)
+    else:
+        for response in time_entry_responses:
+            for task in response["data"]:
+                duration_per_user[task["user"]["username"]] += int(task["duration"])
 
-    return duration_per_user
+    return {
+        user: unix_time_in_milliseconds_to_duration(duration)
+        for user, duration in duration_per_user.items()
+    }
 
 
 @router.get("/user_tasks")
@@ -221,9 +269,6 @@ async def user_tasks(
     ] = None,
     token: str | None = None,
 ) -> dict:
-
-    validate_token(token)
-
     # cleaning team_id of trailing commas and spaces
     if team_id:
         team_id = [team_id[0].strip().strip(",")]
@@ -236,7 +281,7 @@ async def user_tasks(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="'team_id' must contain numbers separated by commas.",
                 )
-    workspaces_ids = await request_workspace_ids(team_id=team_id)
+    workspaces_ids = await request_workspace_ids(team_id=team_id, token=token)
 
     # getting user_id from username:
     assignee = await request_assignee_by_username(username, token)
@@ -250,11 +295,9 @@ async def user_tasks(
         token=token,
     )
 
-    # all unique tasks by ids (one task can appear many times depending on the number
-    # of times tracked):
-    task_ids = []
-    # all time tracked ids for all tasks (each time track has its own id):
-    task_entry_ids = []
+    # all unique tasks by ids (one task can appear many times depending on
+    # the number of times tracked):
+    tasks_by_id: dict[str, dict] = {}
 
     user_tasks = {
         "username": username,
@@ -266,51 +309,31 @@ async def user_tasks(
     # for each workspace must be made separately:
     for response in time_entry_responses:
         # accessing response data from request made on get_time_entries on each workspace:
-        if response["data"]:
-            for task in response["data"]:
-                # increasing time duration for existing task in user_tasks dict
-                # (task with multiple time entrances):
-                if task["task"]["id"] in task_ids:
-                    for element in user_tasks["tasks"]:
-                        if task["task"]["id"] == element["task_id"]:
-                            element["duration"] += int(task["duration"])
-                            task_entry_ids.append(task["id"])
-                # adding a new task to user_tasks dict:
-                else:
-                    task_entry_ids.append(task["id"])
-                    task_ids.append(task["task"]["id"])
-                    new_task = {}
-                    new_task["task_id"] = (
-                        task["task"]["id"] if "task" in task.keys() else None
-                    )
-                    new_task["custom_id"] = (
-                        task["task"]["custom_id"]
-                        if "task" in task.keys() and "custom_id" in task["task"].keys()
-                        else None
-                    )
-                    new_task["task_name"] = (
-                        task["task"]["name"] if "task" in task.keys() else None
-                    )
-                    new_task["duration"] = (
-                        int(task["duration"]) if "duration" in task.keys() else None
-                    )
-                    new_task["custom_id"] = (
-                        task["custom_items"]["id"]
-                        if "custom_items" in task.keys()
-                        else None
-                    )
-                    user_tasks["tasks"].append(new_task)
+        for task in response["data"]:
+            task_obj = task.get("task") or {}
+            task_id = task_obj.get("id")
+            duration = int(task.get("duration", 0))
+            task_record = tasks_by_id.get(task_id)
+            # increasing time duration for existing task (task with multiple
+            # time entrances):
+            if task_record:
+                task_record["duration"] += duration
+            # adding a new task:
+            else:
+                tasks_by_id[task_id] = {
+                    "task_id": task_id,
+                    "custom_id": task_obj.get("custom_id"),
+                    "task_name": task_obj.get("name"),
+                    "duration": duration,
+                }
+    user_tasks["tasks"] = list(tasks_by_id.values())
 
     # converting Epoch time to datetime for each task:
     for task in user_tasks["tasks"]:
-        task["duration"] = str(
-            datetime.timedelta(seconds=int(task["duration"]) / 1000)
-        ).split(".")[0]
+        task["duration"] = unix_time_in_milliseconds_to_duration(task["duration"])
 
-    # DEBUG:
-    # print("✅ data set:", time_entry_responses)
-    # print("✅ task_ids:", task_ids, "list length:", len(task_ids))
-    # print("✅ task_entry_ids:", task_entry_ids, "list length:", len(task_entry_ids))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("user %r: %d tasks", username, len(tasks_by_id))
 
     return user_tasks
 
@@ -331,38 +354,28 @@ async def create_checklist_items(
     Add many items to a checklist. Use 'task_id' and 'checklist_name' to create a new
     checklist for items or use 'checklist_id' to add items to the existing checklist.
     """
-    if (not task_id and not checklist_id) or (task_id and checklist_id):
-        raise HTTPException(
-            status_code=status.HTTP_406_NOT_ACCEPTABLE,
-            detail="Either 'task_id' or 'checklist_id' must be set (not both).",
-        )
-    if checklist_name and checklist_id:
-        raise HTTPException(
-            status_code=status.HTTP_406_NOT_ACCEPTABLE,
-            detail="Set either 'checklist_name' or 'checklist_id', not both.",
-        )
-    if (task_id and not checklist_name) or (checklist_name and not task_id):
+    mode = _CHECKLIST_MODES.get(
+        (bool(task_id), bool(checklist_id), bool(checklist_name))
+    )
+    if mode is None:
         raise HTTPException(
             status_code=status.HTTP_406_NOT_ACCEPTABLE,
-            detail="For creating a new checklist with items, both team_id' "
-            "and 'checklist_name' are required.",
+            detail="Set either 'task_id' and 'checklist_name' to create a new "
+            "checklist or only 'checklist_id' to add items to existing checklist.",
         )
 
-    if task_id:
+    if mode == "new":
         new_checklist = await create_checklist(
             task_id,
-            name={"name": checklist_name},
+            name=CreateChecklist(name=checklist_name),
             custom_task_ids=custom_task_ids,
             team_id=team_id,
             token=token,
         )
-        # print("✅ new_checklist: ", new_checklist)
-
         checklist_id = new_checklist["checklist"]["id"]
 
     for item in checklist_items:
-        new_item = await create_checklist_item(checklist_id, item, token)
-        # print("✅ new_item: ", new_item)
+        await create_checklist_item(checklist_id, item, token)
 
     return Response(status_code=status.HTTP_201_CREATED)
 
@@ -379,41 +392,30 @@ async def create_task_with_checklist_and_items(
     team_id: int | None = None,
     token: str | None = None,
 ):
-
-    validate_token(token)
-
-    # print("✅ task: ", task)
-    # print("✅ task_encoded: ", jsonable_encoder(task))
-
     new_task = await create_task(
         list_id,
-        task=jsonable_encoder(task)["task"],
+        task=task.task,
         custom_task_ids=custom_task_ids,
         team_id=team_id,
         token=token,
     )
 
-    # print("✅ new_task: ", new_task)
     task_id = new_task["id"]
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("created task %s", task_id)
 
-    for checklist in jsonable_encoder(task)["checklists"]:
-        # print("✅ checklist: ", checklist)
-        # print("✅ checklist name: ", checklist["name"])
-
+    for checklist in task.checklists:
         new_checklist = await create_checklist(
             task_id,
-            name={"name": checklist["name"]},
+            name=CreateChecklist.model_construct(name=checklist.name),
             custom_task_ids=custom_task_ids,
             team_id=team_id,
             token=token,
         )
-        # print("✅ new_checklist: ", new_checklist)
-
         checklist_id = new_checklist["checklist"]["id"]
 
-        for item in checklist["items"]:
-            new_item = await create_checklist_item(checklist_id, item, token)
-            # print("✅ new_item: ", new_item)
+        for item in checklist.items or []:
+            await create_checklist_item(checklist_id, item, token)
 
     return await get_task(task_id)
     # return task.model_dump_json()
@@ -1,24 +1,24 @@
+import orjson
 import requests
-from fastapi import APIRouter, HTTPException, Query, status
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Query, status
 
 from ..enums import Static
-from ..utils import header, validate_token
+from ..utils import header, upstream_error, validate_token
 
-router = APIRouter(tags=["ClickUp delete methods"])
+router = APIRouter(
+    tags=["ClickUp delete methods"], dependencies=[Depends(validate_token)]
+)
 
-URL = Static.URL
+URL = Static.URL.value
 
 
 @router.delete("/comment/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_comment(comment_id: str, token: str | None = None):
-    validate_token(token)
-    url = f"{URL}/comment/{str(comment_id)}"
+    url = f"{URL}/comment/{comment_id}"
     response = requests.delete(url, headers=header(token=token))
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return orjson.loads(response.content)
 
 
 @router.delete("/list/{list_id}/task/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -27,34 +27,31 @@ async def remove_task_from_a_list(list_id: int, task_id: str, token: str | None
     Remove a task from an additional List. You can't remove a task from its home List.
     Note: This endpoint requires the Tasks in Multiple List ClickApp to be enabled.
     """
-    validate_token(token)
-    url = f"{URL}/list/{str(list_id)}/task/{str(task_id)}"
+    url = f"{URL}/list/{list_id}/task/{task_id}"
     response = requests.delete(url, headers=header(token=token))
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return orjson.loads(response.content)
 
 
 @router.delete("/task/{task_id}")
 async def delete_task(task_id: str, token: str | None = None):
-    validate_token(token)
-    url = f"{URL}/task/{str(task_id)}"
+    url = f"{URL}/task/{task_id}"
     response = requests.delete(
         url, headers=header(token=token, content_type="application/json")
     )
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return JSONResponse(content=jsonable_encoder(response))
+        raise upstream_error(response)
+    return orjson.loads(response.content)
 
 
 @router.delete("/checklist/{checklist_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_checklist(checklist_id: str, token: str | None = None):
-    validate_token(token)
-    url = f"{URL}/checklist/{str(checklist_id)}"
+    url = f"{URL}/checklist/{checklist_id}"
     response = requests.delete(url, headers=header(token=token))
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return orjson.loads(response.content)
 
 
 @router.delete(
@@ -64,24 +61,22 @@ async def delete_checklist(checklist_id: str, token: str | None = None):
 async def delete_checklist_item(
     checklist_id: str, checklist_item_id: str, token: str | None = None
 ):
-    validate_token(token)
-    url = f"{URL}/checklist/{str(checklist_id)}/checklist_item/{str(checklist_item_id)}"
+    url = f"{URL}/checklist/{checklist_id}/checklist_item/{checklist_item_id}"
     response = requests.delete(url, headers=header(token=token))
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return orjson.loads(response.content)
 
 
 @router.delete(
     "/task/{task_id}/link/{links_to}", status_code=status.HTTP_204_NO_CONTENT
 )
 async def delete_task_link(task_id: str, links_to: str, token: str | None = None):
-    validate_token(token)
-    url = f"{URL}/task/{str(task_id)}/link/{str(links_to)}"
+    url = f"{URL}/task/{task_id}/link/{links_to}"
     response = requests.delete(url, headers=header(token=token))
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return orjson.loads(response.content)
 
 
 @router.delete("/task/{task_id}/dependency", status_code=status.HTTP_204_NO_CONTENT)
@@ -95,8 +90,7 @@ async def delete_task_dependency(
     ),
     token: str | None = None,
 ):
-    validate_token(token)
-    url = f"{URL}/task/{str(task_id)}/dependency"
+    url = f"{URL}/task/{task_id}/dependency"
 
     query = {"depends_on": depends_on, "dependency_of": dependency_of}
 
@@ -104,5 +98,5 @@ async def delete_task_dependency(
         url, params=query, headers=header(token=token, content_type="application/json")
     )
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return orjson.loads(response.content)
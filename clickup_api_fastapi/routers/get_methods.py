@@ -1,47 +1,49 @@
 import datetime
 from typing import Annotated
 
+import orjson
 import requests
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.concurrency import run_in_threadpool
 
-from clickup_api.handlers import (date_as_string_to_unix_time_in_milliseconds,
+from clickup_api.handlers import (convert_date_strings,
+                                  date_as_string_to_unix_time_in_milliseconds,
                                   split_int_array, split_string_array)
 from clickup_api_fastapi.enums import Static
 
-from ..utils import header, validate_token
+from ..utils import (header, passthrough, passthrough_stream, upstream_error,
+                     validate_token)
 
 # uvicorn clickup_api_fastapi.main:app --reload
+# uvicorn clickup_api_fastapi.main:app --loop uvloop --http httptools --workers 4
 
-router = APIRouter(tags=["ClickUp get methods"])
+router = APIRouter(tags=["ClickUp get methods"], dependencies=[Depends(validate_token)])
 
 URL = Static.URL.value
+_BOOL = ("false", "true")
 
 
-@router.get("/authorized_user")
+@router.get("/authorized_user", response_model=None)
 async def get_authorized_user(token: str | None = None):
-
-    validate_token(token)
     url = f"{URL}/user"
     response = requests.get(url, headers=header(token))
 
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return passthrough(response)
 
 
-@router.get("/authorized_teams_workspaces")
+@router.get("/authorized_teams_workspaces", response_model=None)
 async def get_authorized_teams_workspaces(token: str | None = None):
-
-    validate_token(token)
     url = f"{URL}/team/"
     response = requests.get(url=url, headers=header(token))
 
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return passthrough(response)
 
 
-@router.get("/group")
+@router.get("/group", response_model=None)
 async def get_teams(
     team_id: Annotated[
         int | None, Query(description="Refers to the id of a Workspace.")
@@ -53,105 +55,91 @@ async def get_teams(
 ):
     """This endpoint is used to view Teams: user groups in your Workspace."""
 
-    validate_token(token)
     url = f"{URL}/group"
     query = {"team_id": team_id, "group_ids": group_ids}
     response = requests.get(url, headers=header(token), params=query)
 
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return passthrough(response)
 
 
-@router.get("/team/{team_id}/space")
+@router.get("/team/{team_id}/space", response_model=None)
 async def get_spaces(team_id: int, token: str | None = None):
-
-    validate_token(token)
-    url = f"{URL}/team/{str(team_id)}/space"
+    url = f"{URL}/team/{team_id}/space"
     response = requests.get(url, headers=header(token))
 
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return passthrough(response)
 
 
-@router.get("/space/{space_id}")
+@router.get("/space/{space_id}", response_model=None)
 async def get_space(space_id: int, token: str | None = None):
-
-    validate_token(token)
-    url = f"{URL}/space/{str(space_id)}"
+    url = f"{URL}/space/{space_id}"
     response = requests.get(url, headers=header(token))
 
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return passthrough(response)
 
 
-@router.get("/space/{space_id}/folder")
+@router.get("/space/{space_id}/folder", response_model=None)
 async def get_folders(space_id: int, archived: bool = False, token: str | None = None):
-
-    validate_token(token)
-    url = f"{URL}/space/{str(space_id)}/folder"
-    query = {"archived": "true" if archived else "false"}
+    url = f"{URL}/space/{space_id}/folder"
+    query = {"archived": _BOOL[archived]}
     response = requests.get(url, headers=header(token), params=query)
 
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return passthrough(response)
 
 
-@router.get("/folder/{folder_id}")
+@router.get("/folder/{folder_id}", response_model=None)
 async def get_folder(folder_id: int, token: str | None = None):
-
-    validate_token(token)
-    url = f"{URL}/folder/{str(folder_id)}"
+    url = f"{URL}/folder/{folder_id}"
     response = requests.get(url, headers=header(token))
 
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return passthrough(response)
 
 
-@router.get("/folder/{folder_id}/list")
+@router.get("/folder/{folder_id}/list", response_model=None)
 async def get_lists(folder_id: int, archived: bool = False, token: str | None = None):
-
-    validate_token(token)
-    url = f"{URL}/folder/{str(folder_id)}/list"
-    query = {"archived": "true" if archived else "false"}
+    url = f"{URL}/folder/{folder_id}/list"
+    query = {"archived": _BOOL[archived]}
     response = requests.get(url, headers=header(token), params=query)
 
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return passthrough(response)
 
 
-@router.get("/list/{list_id}")
+@router.get("/list/{list_id}", response_model=None)
 async def get_list(list_id: int, token: str | None = None):
-
-    validate_token(token)
-    url = f"{URL}/list/{str(list_id)}"
+    url = f"{URL}/list/{list_id}"
     response = requests.get(url, headers=header(token))
 
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return passthrough(response)
 
 
-@router.get("/space/{space_id}/list")
+@router.get("/space/{space_id}/list", response_model=None)
 async def get_folderless_lists(
     space_id: int, archived: bool = False, token: str | None = None
 ):
-    validate_token(token)
-    url = f"{URL}/space/{str(space_id)}/list"
-    query = {"archived": "true" if archived else "false"}
+    url = f"{URL}/space/{space_id}/list"
+    query = {"archived": _BOOL[archived]}
     response = requests.get(url, headers=header(token), params=query)
 
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return passthrough(response)
 
 
-@router.get("/list/{list_id}/task")
+@router.get("/list/{list_id}/task", response_model=None)
 async def get_tasks(
     list_id: int,
     archived: bool = False,
@@ -169,7 +157,7 @@ async def get_tasks(
     ] = None,
     include_closed: bool = False,
     assignees: Annotated[
-        list[int | str] | None,
+        list[str] | None,
         Query(description="Filter by Assignees. Use comma to separate ids."),
     ] = None,
     tags: Annotated[
@@ -257,41 +245,58 @@ async def get_tasks(
     Tasks added to the list_id with a different home List are not included in the response.
     """
 
-    validate_token(token)
-    url = f"{URL}/list/{str(list_id)}/task"
+    url = f"{URL}/list/{list_id}/task"
 
+    # only non-default values are sent - ClickUp treats missing flags as false
     query = {
-        "archived": "true" if archived else "false",
-        "include_markdown_description": (
-            "true" if include_markdown_description else "false"
-        ),
-        "page": page,
-        "order_by": order_by,
-        "reverse": "true" if reverse else "false",
-        "subtasks": "true" if subtasks else None,
         "statuses": split_string_array(statuses),
-        "include_closed": "true" if include_closed else "false",
-        "assignees": split_string_array(assignees),
+        # repeated keys are merged with comma-separated values:
+        "assignees": split_string_array([",".join(assignees)]) if assignees else None,
         "tags": split_string_array(tags),
-        "due_date_gt": date_as_string_to_unix_time_in_milliseconds(due_date_gt),
-        "due_date_lt": date_as_string_to_unix_time_in_milliseconds(due_date_lt),
-        "date_created_gt": date_as_string_to_unix_time_in_milliseconds(date_created_gt),
-        "date_created_lt": date_as_string_to_unix_time_in_milliseconds(date_created_lt),
-        "date_updated_gt": date_as_string_to_unix_time_in_milliseconds(date_updated_gt),
-        "date_updated_lt": date_as_string_to_unix_time_in_milliseconds(date_updated_lt),
-        "date_done_gt": date_as_string_to_unix_time_in_milliseconds(date_done_gt),
-        "date_done_lt": date_as_string_to_unix_time_in_milliseconds(date_done_lt),
         # "custom_fields": custom_fields,
-        "custom_items": split_int_array(custom_items),
+        "custom_items": (
+            split_int_array([",".join(custom_items)]) if custom_items else None
+        ),
     }
-
-    response = requests.get(url, headers=header(token), params=query)
+    query.update(
+        convert_date_strings(
+            {
+                "due_date_gt": due_date_gt,
+                "due_date_lt": due_date_lt,
+                "date_created_gt": date_created_gt,
+                "date_created_lt": date_created_lt,
+                "date_updated_gt": date_updated_gt,
+                "date_updated_lt": date_updated_lt,
+                "date_done_gt": date_done_gt,
+                "date_done_lt": date_done_lt,
+            }
+        )
+    )
+    if page:
+        query["page"] = page
+    if order_by != "created":
+        query["order_by"] = order_by
+    for flag, value in (
+        ("archived", archived),
+        ("include_markdown_description", include_markdown_description),
+        ("reverse", reverse),
+        ("subtasks", subtasks),
+        ("include_closed", include_closed),
+    ):
+        if value:
+            query[flag] = "true"
+
+    # sent from a worker thread - a blocking call would stall the event loop
+    # until ClickUp answers with the response headers:
+    response = await run_in_threadpool(
+        requests.get, url, headers=header(token), params=query, stream=True
+    )
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return passthrough_stream(response)
 
 
-@router.get("/task/{task_id}")
+@router.get("/task/{task_id}", response_model=None)
 async def get_task(
     task_id: str,
     custom_task_ids: bool = False,
@@ -302,40 +307,86 @@ async def get_task(
 ):
     """You can only view task information of tasks you can access."""
 
-    validate_token(token)
-    url = f"{URL}/task/{str(task_id)}"
+    url = f"{URL}/task/{task_id}"
 
-    custom_task_ids = "true" if team_id or custom_task_ids else "false"
+    custom_task_ids = _BOOL[bool(team_id or custom_task_ids)]
 
     query = {
         "custom_task_ids": custom_task_ids,
         "team_id": team_id,
-        "include_subtasks": "true" if include_subtasks else "false",
-        "include_markdown_description": (
-            "true" if include_markdown_description else "false"
-        ),
+        "include_subtasks": _BOOL[include_subtasks],
+        "include_markdown_description": (_BOOL[include_markdown_description]),
     }
 
     response = requests.get(url, headers=header(token), params=query)
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return passthrough(response)
 
 
-@router.get("/team/{team_id}/user/{user_id}")
+@router.get("/team/{team_id}/user/{user_id}", response_model=None)
 async def get_user(team_id: int, user_id: int, token: str | None = None):
     """This endpoint is only available to Workspaces on Enterprise Plan."""
 
-    validate_token(token)
-    url = f"{URL}/team/{str(team_id)}/user/{str(user_id)}"
+    url = f"{URL}/team/{team_id}/user/{user_id}"
     response = requests.get(url, headers=header(token))
 
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return passthrough(response)
 
 
-@router.get("/team/{team_id}/time_entries")
+def _request_time_entries(
+    team_id: int,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    assignee: int | str | None = None,
+    include_task_tags: bool = False,
+    include_location_names: bool = False,
+    space_id: int | None = None,
+    folder_id: int | None = None,
+    list_id: int | None = None,
+    task_id: str | None = None,
+    custom_task_ids: bool = False,
+    query_team_id: int | None = None,
+    token: str | None = None,
+    stream: bool = False,
+) -> requests.Response:
+    """Sends get_time_entries request to ClickUp - shared by the route, which streams
+    the body to the client, and by time_entries_json for internal callers."""
+    url = f"{URL}/team/{team_id}/time_entries"
+
+    if not start_date:
+        start_date = (
+            str(datetime.date.today().year)
+            + ","
+            + str(datetime.date.today().month)
+            + ",1"
+        )
+
+    query = {
+        "start_date": date_as_string_to_unix_time_in_milliseconds(start_date),
+        "end_date": date_as_string_to_unix_time_in_milliseconds(end_date),
+        "assignee": assignee,
+        "space_id": space_id,
+        "folder_id": folder_id,
+        "list_id": list_id,
+        "task_id": task_id,
+        "team_id": query_team_id,
+    }
+    # only non-default values are sent - ClickUp treats missing flags as false
+    for flag, value in (
+        ("include_task_tags", include_task_tags),
+        ("include_location_names", include_location_names),
+        ("custom_task_ids", query_team_id or custom_task_ids),
+    ):
+        if value:
+            query[flag] = "true"
+
+    return requests.get(url, headers=header(token), params=query, stream=stream)
+
+
+@router.get("/team/{team_id}/time_entries", response_model=None)
 async def get_time_entries(
     team_id: int,
     start_date: Annotated[
@@ -376,39 +427,40 @@ async def get_time_entries(
     ] = None,
     token: str | None = None,
 ):
-    validate_token(token)
-    url = f"{URL}/team/{str(team_id)}/time_entries"
-
-    custom_task_ids = "true" if query_team_id or custom_task_ids else "false"
-    if not start_date:
-        start_date = (
-            str(datetime.date.today().year)
-            + ","
-            + str(datetime.date.today().month)
-            + ",1"
-        )
+    response = await run_in_threadpool(
+        _request_time_entries,
+        team_id,
+        start_date=start_date,
+        end_date=end_date,
+        assignee=assignee,
+        include_task_tags=include_task_tags,
+        include_location_names=include_location_names,
+        space_id=space_id,
+        folder_id=folder_id,
+        list_id=list_id,
+        task_id=task_id,
+        custom_task_ids=custom_task_ids,
+        query_team_id=query_team_id,
+        token=token,
+        stream=True,
+    )
+    if not response.status_code < 400:
+        raise upstream_error(response)
+    return passthrough_stream(response)
 
-    query = {
-        "start_date": date_as_string_to_unix_time_in_milliseconds(start_date),
-        "end_date": date_as_string_to_unix_time_in_milliseconds(end_date),
-        "assignee": assignee,
-        "include_task_tags": "true" if include_task_tags else "false",
-        "include_location_names": "true" if include_location_names else "false",
-        "space_id": space_id,
-        "folder_id": folder_id,
-        "list_id": list_id,
-        "task_id": task_id,
-        "custom_task_ids": custom_task_ids,
-        "team_id": query_team_id,
-    }
 
-    response = requests.get(url, headers=header(token), params=query)
+async def time_entries_json(team_id: int, **kwargs) -> dict:
+    """Returns decoded get_time_entries body for internal callers. The whole body is
+    decoded anyway, so it is requested without streaming."""
+    # sent from a worker thread, so that requests for many workspaces can run
+    # concurrently (see additional_methods.request_time_entries_for_workspace_ids):
+    response = await run_in_threadpool(_request_time_entries, team_id, **kwargs)
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return orjson.loads(response.content)
 
 
-@router.get("/task/{task_id}/comment")
+@router.get("/task/{task_id}/comment", response_model=None)
 async def get_task_comments(
     task_id: str,
     custom_task_ids: bool = False,
@@ -430,10 +482,9 @@ async def get_task_comments(
     return the most recent 25 comments. Use the start and start id parameters of the
     oldest comment to retrieve the next 25 comments."""
 
-    validate_token(token)
-    url = f"{URL}/task/{str(task_id)}/comment"
+    url = f"{URL}/task/{task_id}/comment"
 
-    custom_task_ids = "true" if team_id or custom_task_ids else "false"
+    custom_task_ids = _BOOL[bool(team_id or custom_task_ids)]
 
     query = {
         "custom_task_ids": custom_task_ids,
@@ -444,11 +495,11 @@ async def get_task_comments(
 
     response = requests.get(url, headers=header(token), params=query)
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return passthrough(response)
 
 
-@router.get("/list/{list_id}/comment")
+@router.get("/list/{list_id}/comment", response_model=None)
 async def get_list_comments(
     list_id: int,
     start: Annotated[
@@ -468,8 +519,7 @@ async def get_list_comments(
     return the most recent 25 comments. Use the start and start id parameters of the
     oldest comment to retrieve the next 25 comments."""
 
-    validate_token(token)
-    url = f"{URL}/list/{int(list_id)}/comment"
+    url = f"{URL}/list/{list_id}/comment"
 
     query = {
         "start": date_as_string_to_unix_time_in_milliseconds(start),
@@ -478,11 +528,11 @@ async def get_list_comments(
 
     response = requests.get(url, headers=header(token), params=query)
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return passthrough(response)
 
 
-@router.get("/view/{view_id}/comment")
+@router.get("/view/{view_id}/comment", response_model=None)
 async def get_chat_view_comments(
     view_id: str,
     start: Annotated[
@@ -502,8 +552,7 @@ async def get_chat_view_comments(
     return the most recent 25 comments. Use the start and start id parameters of the
     oldest comment to retrieve the next 25 comments."""
 
-    validate_token(token)
-    url = f"{URL}/view/{str(view_id)}/comment"
+    url = f"{URL}/view/{view_id}/comment"
 
     query = {
         "start": date_as_string_to_unix_time_in_milliseconds(start),
@@ -512,29 +561,25 @@ async def get_chat_view_comments(
 
     response = requests.get(url, headers=header(token), params=query)
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return passthrough(response)
 
 
-@router.get("/team/{team_id}/custom_item")
+@router.get("/team/{team_id}/custom_item", response_model=None)
 async def get_custom_task_types(team_id: int, token: str | None = None):
-
-    validate_token(token)
-    url = f"{URL}/team/{int(team_id)}/custom_item"
+    url = f"{URL}/team/{team_id}/custom_item"
     response = requests.get(url, headers=header(token))
 
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return passthrough(response)
 
 
-@router.get("/list/{list_id}/field")
+@router.get("/list/{list_id}/field", response_model=None)
 async def get_accessible_custom_fields(list_id: int, token: str | None = None):
-
-    validate_token(token)
-    url = f"{URL}/list/{int(list_id)}/field"
+    url = f"{URL}/list/{list_id}/field"
     response = requests.get(url, headers=header(token))
 
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return passthrough(response)
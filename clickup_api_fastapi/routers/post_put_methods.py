@@ -1,36 +1,51 @@
-from typing import Annotated, Optional, Type
+import logging
+from typing import Optional
 
+import orjson
 import requests
-from fastapi import APIRouter, Body, HTTPException, Path, Query
-from fastapi.encoders import jsonable_encoder
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, HTTPException, Path
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from starlette import status
 
 from clickup_api.handlers import (date_as_dict_to_unix_time_in_milliseconds,
                                   time_as_dict_to_unix_time_in_milliseconds)
 
 from ..enums import Static
-from ..utils import header, validate_token
+from ..utils import header, response_json, upstream_error, validate_token
 from .get_methods import get_task
 
-router = APIRouter(tags=["ClickUp post/put methods"])
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    tags=["ClickUp post/put methods"], dependencies=[Depends(validate_token)]
+)
 
 URL = Static.URL.value
+_BOOL = ("false", "true")
+
+# shared by all request models - unknown keys are dropped, no re-validation on setattr
+_MODEL_CONFIG = ConfigDict(extra="ignore", validate_assignment=False)
 
 
 class DateRequest(BaseModel):
+    model_config = _MODEL_CONFIG
+
     year: int = Field(default=None, gt=2000, examples=[2024])
     month: int = Field(default=None, gt=0, lt=13, examples=[3])
     day: int = Field(default=None, gt=0, lt=32, examples=[25])
 
 
 class TimeEstimate(BaseModel):
+    model_config = _MODEL_CONFIG
+
     days: int = Field(default=None, ge=0, examples=[0])
     hours: int = Field(default=None, ge=0, examples=[4])
     minutes: int = Field(default=None, ge=0, examples=[30])
 
 
 class CustomFields(BaseModel):
+    model_config = _MODEL_CONFIG
+
     id: str = Field(
         description="Field id", examples=[None, "abcd1234-xzy1-987a-11bb-abd1234xyz987"]
     )
@@ -38,11 +53,15 @@ class CustomFields(BaseModel):
 
 
 class EditAssignees(BaseModel):
-    add: list[int] | None = None
-    rem: list[int] | None = None
+    model_config = _MODEL_CONFIG
+
+    add: list[int] = Field(default_factory=list)
+    rem: list[int] = Field(default_factory=list)
 
 
 class TaskBasicRequest(BaseModel):
+    model_config = _MODEL_CONFIG
+
     name: str = Field(min_length=1, examples=["New task name"])
     description: str | None = Field(default=None, examples=["Task description"])
     parent: str | None = Field(
@@ -96,10 +115,14 @@ class UpdateTaskFullRequest(TaskBasicRequest):
 
 
 class CreateChecklist(BaseModel):
+    model_config = _MODEL_CONFIG
+
     name: str = Field(min_length=1)
 
 
 class UpdateChecklist(BaseModel):
+    model_config = _MODEL_CONFIG
+
     name: str | None = Field(default=None, min_length=1)
     position: int | None = Field(
         default=None,
@@ -111,11 +134,15 @@ class UpdateChecklist(BaseModel):
 
 
 class CreateChecklistItem(BaseModel):
+    model_config = _MODEL_CONFIG
+
     name: str = Field(min_length=1)
     assignee: int | None = Field(default=None, examples=[None])
 
 
 class UpdateChecklistItem(BaseModel):
+    model_config = _MODEL_CONFIG
+
     name: str | None = Field(default=None, min_length=1)
     assignee: int | None = Field(default=None, examples=[None])
     remove_assignee: bool = Field(
@@ -135,6 +162,8 @@ class UpdateChecklistItem(BaseModel):
 
 
 class Comment(BaseModel):
+    model_config = _MODEL_CONFIG
+
     comment_text: str
     assignee: int | None = Field(default=None, examples=[None])
 
@@ -150,11 +179,15 @@ class UpdateComment(Comment):
 
 
 class ChatViewComment(BaseModel):
+    model_config = _MODEL_CONFIG
+
     comment_text: str
     notify_all: bool = False
 
 
 class TaskDependency(BaseModel):
+    model_config = _MODEL_CONFIG
+
     depends_on: str | None = Field(
         default=None, description="ID of the task", examples=[None]
     )
@@ -163,6 +196,12 @@ class TaskDependency(BaseModel):
     )
 
 
+# Built once at import time - request bodies are already validated by FastAPI,
+# the adapters are only used to serialize them.
+_CREATE_TASK_ADAPTER = TypeAdapter(CreateTaskFullRequest)
+_UPDATE_TASK_ADAPTER = TypeAdapter(UpdateTaskFullRequest)
+
+
 @router.post("/list/{list_id}/task", status_code=status.HTTP_201_CREATED)
 async def create_task(
     list_id: int,
@@ -171,41 +210,40 @@ async def create_task(
     team_id: int | None = None,
     token: str | None = None,
 ):
-    validate_token(token)
-    url = f"{URL}/list/{str(list_id)}/task"
+    url = f"{URL}/list/{list_id}/task"
 
-    custom_task_ids = "true" if team_id or custom_task_ids else "false"
+    custom_task_ids = _BOOL[bool(team_id or custom_task_ids)]
 
     query = {"custom_task_ids": custom_task_ids, "team_id": team_id}
 
-    # print("✅ task: ", task)
-    update_task_encoded = jsonable_encoder(task)
-    # print("✅ task json: ", update_task_encoded)
+    update_task_encoded = _CREATE_TASK_ADAPTER.dump_python(
+        task, mode="json", exclude_none=True
+    )
 
-    if update_task_encoded["due_date"]:
+    if update_task_encoded.get("due_date"):
         update_task_encoded["due_date"] = date_as_dict_to_unix_time_in_milliseconds(
             update_task_encoded["due_date"]
         )
-    if update_task_encoded["start_date"]:
+    if update_task_encoded.get("start_date"):
         update_task_encoded["start_date"] = date_as_dict_to_unix_time_in_milliseconds(
             update_task_encoded["start_date"]
         )
-    if update_task_encoded["time_estimate"]:
+    if update_task_encoded.get("time_estimate"):
         update_task_encoded["time_estimate"] = (
             time_as_dict_to_unix_time_in_milliseconds(
                 update_task_encoded["time_estimate"]
             )
         )
 
-    # print("✅ task json update: ", update_task_encoded)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("task json: %r", update_task_encoded)
 
     response = requests.post(
         url, headers=header(token), params=query, json=update_task_encoded
     )
-    # print("✅ task json: ", response.json())
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return orjson.loads(response.content)
 
 
 @router.put("/task/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -216,24 +254,28 @@ async def edit_task(
     team_id: int | None = None,
     token: str | None = None,
 ):
-    validate_token(token)
-    url = f"{URL}/task/{str(task_id)}"
+    url = f"{URL}/task/{task_id}"
 
-    custom_task_ids = "true" if team_id or custom_task_ids else "false"
+    custom_task_ids = _BOOL[bool(team_id or custom_task_ids)]
 
     query = {"custom_task_ids": custom_task_ids, "team_id": team_id}
 
-    update_task_encoded = jsonable_encoder(task)
+    # only fields sent by the client - an explicit null clears the value in ClickUp:
+    update_task_encoded = _UPDATE_TASK_ADAPTER.dump_python(
+        task, mode="json", exclude_unset=True
+    )
+    if task.assignees is not None and "assignees" in update_task_encoded:
+        update_task_encoded["assignees"] = task.assignees.model_dump(mode="json")
 
-    if update_task_encoded["due_date"]:
+    if update_task_encoded.get("due_date"):
         update_task_encoded["due_date"] = date_as_dict_to_unix_time_in_milliseconds(
             update_task_encoded["due_date"]
         )
-    if update_task_encoded["start_date"]:
+    if update_task_encoded.get("start_date"):
         update_task_encoded["start_date"] = date_as_dict_to_unix_time_in_milliseconds(
             update_task_encoded["start_date"]
         )
-    if update_task_encoded["time_estimate"]:
+    if update_task_encoded.get("time_estimate"):
         update_task_encoded["time_estimate"] = (
             time_as_dict_to_unix_time_in_milliseconds(
                 update_task_encoded["time_estimate"]
@@ -244,8 +286,8 @@ async def edit_task(
         url, headers=header(token), params=query, json=update_task_encoded
     )
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return orjson.loads(response.content)
 
 
 @router.post("/task/{task_id}/link/{links_to}", status_code=status.HTTP_201_CREATED)
@@ -258,17 +300,16 @@ async def add_task_link(
     team_id: int | None = None,
     token: str | None = None,
 ):
-    validate_token(token)
-    url = f"{URL}/task/{str(task_id)}/link/{str(links_to)}"
+    url = f"{URL}/task/{task_id}/link/{links_to}"
 
-    custom_task_ids = "true" if team_id or custom_task_ids else "false"
+    custom_task_ids = _BOOL[bool(team_id or custom_task_ids)]
 
     query = {"custom_task_ids": custom_task_ids, "team_id": team_id}
 
     response = requests.post(url, headers=header(token), params=query)
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return orjson.loads(response.content)
 
 
 @router.post("/task/{task_id}/dependency", status_code=status.HTTP_201_CREATED)
@@ -279,26 +320,27 @@ async def add_task_dependency(
     team_id: int | None = None,
     token: str | None = None,
 ):
-    validate_token(token)
-    url = f"{URL}/task/{str(task_id)}/dependency"
+    url = f"{URL}/task/{task_id}/dependency"
 
-    dependency_encoded = jsonable_encoder(dependency)
-    if dependency_encoded["depends_on"] and dependency_encoded["dependency_of"]:
+    if dependency.depends_on and dependency.dependency_of:
         raise HTTPException(
             status_code=status.HTTP_406_NOT_ACCEPTABLE,
             detail="Use either 'depends_on' or 'dependency_of', not both.",
         )
 
-    custom_task_ids = "true" if team_id or custom_task_ids else "false"
+    custom_task_ids = _BOOL[bool(team_id or custom_task_ids)]
 
     query = {"custom_task_ids": custom_task_ids, "team_id": team_id}
 
     response = requests.post(
-        url, headers=header(token), params=query, json=jsonable_encoder(dependency)
+        url,
+        headers=header(token),
+        params=query,
+        json=dependency.model_dump(mode="json", exclude_none=True),
     )
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return orjson.loads(response.content)
 
 
 @router.post("/task/{task_id}/comment", status_code=status.HTTP_201_CREATED)
@@ -309,19 +351,21 @@ async def create_task_comment(
     team_id: int | None = None,
     token: str | None = None,
 ):
-    validate_token(token)
-    url = f"{URL}/task/{str(task_id)}/comment"
+    url = f"{URL}/task/{task_id}/comment"
 
-    custom_task_ids = "true" if team_id or custom_task_ids else "false"
+    custom_task_ids = _BOOL[bool(team_id or custom_task_ids)]
 
     query = {"custom_task_ids": custom_task_ids, "team_id": team_id}
 
     response = requests.post(
-        url, headers=header(token), params=query, json=jsonable_encoder(comment)
+        url,
+        headers=header(token),
+        params=query,
+        json=comment.model_dump(mode="json", exclude_none=True),
     )
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return orjson.loads(response.content)
 
 
 @router.post("/list/{list_id}/comment", status_code=status.HTTP_201_CREATED)
@@ -330,13 +374,16 @@ async def create_list_comment(
     comment: CreateComment,
     token: str | None = None,
 ):
-    validate_token(token)
-    url = f"{URL}/list/{str(list_id)}/comment"
+    url = f"{URL}/list/{list_id}/comment"
 
-    response = requests.post(url, headers=header(token), json=jsonable_encoder(comment))
+    response = requests.post(
+        url,
+        headers=header(token),
+        json=comment.model_dump(mode="json", exclude_none=True),
+    )
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return orjson.loads(response.content)
 
 
 @router.post("/view/{view_id}/comment", status_code=status.HTTP_201_CREATED)
@@ -345,13 +392,16 @@ async def create_chat_view_comment(
     comment: ChatViewComment,
     token: str | None = None,
 ):
-    validate_token(token)
-    url = f"{URL}/view/{str(view_id)}/comment"
+    url = f"{URL}/view/{view_id}/comment"
 
-    response = requests.post(url, headers=header(token), json=jsonable_encoder(comment))
+    response = requests.post(
+        url,
+        headers=header(token),
+        json=comment.model_dump(mode="json", exclude_none=True),
+    )
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return orjson.loads(response.content)
 
 
 @router.put("/comment/{comment_id}", status_code=status.HTTP_202_ACCEPTED)
@@ -362,19 +412,21 @@ async def update_comment(
     team_id: int | None = None,
     token: str | None = None,
 ):
-    validate_token(token)
-    url = f"{URL}/comment/{str(comment_id)}"
+    url = f"{URL}/comment/{comment_id}"
 
-    custom_task_ids = "true" if team_id or custom_task_ids else "false"
+    custom_task_ids = _BOOL[bool(team_id or custom_task_ids)]
 
     query = {"custom_task_ids": custom_task_ids, "team_id": team_id}
 
     response = requests.put(
-        url, headers=header(token), params=query, json=jsonable_encoder(comment)
+        url,
+        headers=header(token),
+        params=query,
+        json=comment.model_dump(mode="json", exclude_unset=True),
     )
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return orjson.loads(response.content)
 
 
 @router.post("/task/{task_id}/checklist", status_code=status.HTTP_201_CREATED)
@@ -385,32 +437,37 @@ async def create_checklist(
     team_id: int | None = None,
     token: str | None = None,
 ):
-    validate_token(token)
-    url = f"{URL}/task/{str(task_id)}/checklist"
+    url = f"{URL}/task/{task_id}/checklist"
 
-    custom_task_ids = "true" if team_id or custom_task_ids else "false"
+    custom_task_ids = _BOOL[bool(team_id or custom_task_ids)]
 
     query = {"custom_task_ids": custom_task_ids, "team_id": team_id}
 
     response = requests.post(
-        url, headers=header(token), params=query, json=jsonable_encoder(name)
+        url,
+        headers=header(token),
+        params=query,
+        json=name.model_dump(mode="json", exclude_none=True),
     )
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return orjson.loads(response.content)
 
 
 @router.put("/checklist/{checklist_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def edit_checklist(
     checklist_id: str, name: UpdateChecklist, token: str | None = None
 ):
-    validate_token(token)
-    url = f"{URL}/checklist/{str(checklist_id)}"
+    url = f"{URL}/checklist/{checklist_id}"
 
-    response = requests.put(url, headers=header(token), json=jsonable_encoder(name))
+    response = requests.put(
+        url,
+        headers=header(token),
+        json=name.model_dump(mode="json", exclude_unset=True),
+    )
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return orjson.loads(response.content)
 
 
 @router.post(
@@ -419,13 +476,14 @@ async def edit_checklist(
 async def create_checklist_item(
     checklist_id: str, item: CreateChecklistItem, token: str | None = None
 ):
-    validate_token(token)
-    url = f"{URL}/checklist/{str(checklist_id)}/checklist_item"
+    url = f"{URL}/checklist/{checklist_id}/checklist_item"
 
-    response = requests.post(url, headers=header(token), json=jsonable_encoder(item))
+    response = requests.post(
+        url, headers=header(token), json=item.model_dump(mode="json", exclude_none=True)
+    )
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return orjson.loads(response.content)
 
 
 @router.put(
@@ -439,29 +497,38 @@ async def edit_checklist_item(
     item: UpdateChecklistItem,
     token: str | None = None,
 ):
-    validate_token(token)
-    url = f"{URL}/checklist/{str(checklist_id)}/checklist_item/{str(checklist_item_id)}"
-
-    item_encoded = jsonable_encoder(item)
-
-    if not item_encoded["name"] or not item_encoded["assignee"]:
-        task = await get_task(task_id)
-        for checklist in task["checklists"]:
-            if checklist["id"] == checklist_id:
-                task_checklist = checklist
-                break
-        for item in task_checklist["items"]:
-            if item["id"] == checklist_item_id:
-                name = item["name"]
-                assignee = None if not item["assignee"] else item["assignee"]["id"]
-                break
-
-    if not item_encoded["name"]:
+    url = f"{URL}/checklist/{checklist_id}/checklist_item/{checklist_item_id}"
+
+    item_encoded = item.model_dump(mode="json", exclude_unset=True)
+
+    if not item_encoded.get("name") or not item_encoded.get("assignee"):
+        task = response_json(await get_task(task_id, token=token))
+        task_checklist = next(
+            (c for c in task["checklists"] if c["id"] == checklist_id), None
+        )
+        if task_checklist is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Checklist '{checklist_id}' not found in task '{task_id}'.",
+            )
+        item_found = next(
+            (i for i in task_checklist["items"] if i["id"] == checklist_item_id), None
+        )
+        if item_found is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Checklist item '{checklist_item_id}' not found "
+                f"in checklist '{checklist_id}'.",
+            )
+        name = item_found["name"]
+        assignee = (item_found.get("assignee") or {}).get("id")
+
+    if not item_encoded.get("name"):
         item_encoded["name"] = name
-    if not item_encoded["assignee"]:
-        item_encoded["assignee"] = None if item_encoded["remove_assignee"] else assignee
+    if not item_encoded.get("assignee"):
+        item_encoded["assignee"] = None if item.remove_assignee else assignee
 
     response = requests.put(url, headers=header(token), json=item_encoded)
     if not response.status_code < 400:
-        raise HTTPException(response.status_code, response.json())
-    return response.json()
+        raise upstream_error(response)
+    return orjson.loads(response.content)
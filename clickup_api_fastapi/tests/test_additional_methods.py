@@ -0,0 +1,72 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+import orjson
+from dotenv import load_dotenv
+from fastapi import Response
+
+from clickup_api_fastapi.routers import additional_methods
+
+load_dotenv()
+
+
+class TestCachedTeamsWorkspaces(unittest.TestCase):
+
+    def setUp(self):
+        additional_methods._teams_workspaces_cache.clear()
+        additional_methods._teams_workspaces_locks.clear()
+        self.calls = 0
+
+    async def authorized_teams_workspaces(self, token: str | None = None):
+        self.calls += 1
+        await asyncio.sleep(0.01)  # lets concurrent calls reach the cache
+        return Response(content=orjson.dumps({"teams": [{"id": "111"}]}))
+
+    def test_cached_teams_workspaces_returns_copy(self):
+        with patch.object(
+            additional_methods,
+            "get_authorized_teams_workspaces",
+            self.authorized_teams_workspaces,
+        ):
+            first = asyncio.run(additional_methods.cached_teams_workspaces("token"))
+            first["teams"].append({"id": "222"})
+            second = asyncio.run(additional_methods.cached_teams_workspaces("token"))
+            second["teams"][0]["id"] = "333"
+            third = asyncio.run(additional_methods.cached_teams_workspaces("token"))
+
+        self.assertEqual(1, self.calls)
+        self.assertEqual({"teams": [{"id": "111"}]}, third)
+
+    def test_cached_teams_workspaces_concurrent_calls_share_request(self):
+        async def gather_calls():
+            return await asyncio.gather(
+                *(additional_methods.cached_teams_workspaces("token") for _ in range(5))
+            )
+
+        with patch.object(
+            additional_methods,
+            "get_authorized_teams_workspaces",
+            self.authorized_teams_workspaces,
+        ):
+            results = asyncio.run(gather_calls())
+
+        self.assertEqual(1, self.calls)
+        self.assertEqual([{"teams": [{"id": "111"}]}] * 5, results)
+        self.assertEqual(5, len({id(result) for result in results}))
+
+    def test_cached_teams_workspaces_cached_per_token(self):
+        with patch.object(
+            additional_methods,
+            "get_authorized_teams_workspaces",
+            self.authorized_teams_workspaces,
+        ):
+            asyncio.run(additional_methods.cached_teams_workspaces("token"))
+            asyncio.run(additional_methods.cached_teams_workspaces("other_token"))
+            asyncio.run(additional_methods.cached_teams_workspaces("token"))
+
+        self.assertEqual(2, self.calls)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,24 +1,94 @@
-from fastapi import HTTPException, status
+import functools
+
+import orjson
+import requests
+from fastapi import HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
 from .enums import Static
 
+_STATIC_TOKEN = getattr(Static.TOKEN, "value", None)
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# upstream headers worth passing on - lets clients honor ClickUp rate limits
+FORWARDED_HEADERS = (
+    "x-ratelimit-limit",
+    "x-ratelimit-remaining",
+    "x-ratelimit-reset",
+    "retry-after",
+)
+
+_DEFAULT_HEADER = {
+    "Authorization": _STATIC_TOKEN,
+    "Content-Type": "application/json",
+}
+
 
 def header(token: str | None = None, content_type: str | None = None) -> dict:
-    if not token:
-        token = Static.TOKEN.value
-    if not content_type:
-        content_type = "application/json"
+    """Returned dicts are shared between requests and must not be mutated."""
+    if not token and not content_type:
+        return _DEFAULT_HEADER
+    return _cached_header(token or _STATIC_TOKEN, content_type or "application/json")
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_header(token: str, content_type: str) -> dict:
     return {"Authorization": token, "Content-Type": content_type}
 
 
-def validate_token(token: str | None) -> bool:
-    if not token:
-        try:
-            token = Static.TOKEN.value
-        except AttributeError:
-            token = None
+def validate_token(token: str | None = Query(default=None)) -> None:
+    """Router-level dependency - reads the same 'token' query parameter as the
+    endpoints and falls back to the token from the environment."""
+    token = token or _STATIC_TOKEN
     if not token or token == "None":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token not found / invalid token.",
         )
+
+
+def forwarded_headers(response: requests.Response) -> dict:
+    """Picks the rate limit headers from a ClickUp response."""
+    return {
+        name: response.headers[name]
+        for name in FORWARDED_HEADERS
+        if name in response.headers
+    }
+
+
+def upstream_error(response: requests.Response) -> HTTPException:
+    """Builds the exception raised when ClickUp responds with an error status."""
+    return HTTPException(
+        status_code=response.status_code,
+        detail=orjson.loads(response.content),
+        headers=forwarded_headers(response),
+    )
+
+
+def passthrough(response: requests.Response) -> Response:
+    """Returns the raw ClickUp response body without decoding and re-encoding it."""
+    return Response(
+        content=response.content,
+        media_type="application/json",
+        status_code=response.status_code,
+        headers=forwarded_headers(response),
+    )
+
+
+def passthrough_stream(response: requests.Response) -> StreamingResponse:
+    """Forwards a ClickUp response requested with stream=True chunk by chunk,
+    without holding the whole body in memory."""
+    return StreamingResponse(
+        response.iter_content(chunk_size=STREAM_CHUNK_SIZE),
+        status_code=response.status_code,
+        media_type="application/json",
+        headers=forwarded_headers(response),
+        background=BackgroundTask(response.close),
+    )
+
+
+def response_json(response: Response) -> dict:
+    """Decodes the body of a passthrough response for internal callers."""
+    return orjson.loads(response.body)
@@ -1,21 +1,116 @@
 from __future__ import annotations
 
+import copy
 import datetime
-from typing import Any
+import hashlib
+import json
+import os
+import shelve
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator
 
 from dotenv import load_dotenv
 
+from clickup_api.handlers import (datetime_to_unix_time_in_milliseconds,
+                                  unix_time_in_milliseconds_to_duration)
+
 from .get_methods import ClickUpGETMethods
 from .post_put_methods import ClickUpPOSTMethods
 
 load_dotenv()
 
+# shelve allows only one writer at a time:
+_TIME_ENTRIES_CACHE_LOCK = threading.Lock()
+
+# allowed (task_id, checklist_id, checklist_name) combinations for adding
+# checklist items - to a new checklist or to existing one:
+_CHECKLIST_MODES = {(True, False, True): "new", (False, True, False): "existing"}
+
+
+def _to_epoch_ms(
+    date: datetime.datetime | list[int] | tuple[int] | int | None,
+    month_start: bool = False,
+) -> int | None:
+    """Converts date to unix time in milliseconds once, before it is passed to many
+    get_time_entries requests. If date is None and month_start is True, returns the
+    beginning of the current month, otherwise None."""
+    if not date and month_start:
+        today = datetime.date.today()
+        date = (today.year, today.month, 1)
+    return datetime_to_unix_time_in_milliseconds(date) if date else None
+
 
 class ClickUpAdditionalMethods(ClickUpPOSTMethods):
 
+    TEAMS_WORKSPACES_TTL = 120  # seconds
+    # concurrent get_time_entries requests, capped to respect rate limits:
+    TIME_ENTRIES_MAX_WORKERS = 8
+    # get_tasks pages requested concurrently in get_all_tasks:
+    TASKS_MAX_WORKERS = 4
+    TASKS_PAGE_SIZE = 100  # tasks per get_tasks page, set by ClickUp API
+    # concurrent comments requests in get_task_comments_many/get_list_comments_many:
+    COMMENTS_MAX_WORKERS = 10
+    # concurrent create_checklist_item requests in add_items_to_a_checklist:
+    CHECKLIST_ITEMS_MAX_WORKERS = 5
+    # on-disk cache of time entries, disabled if no path is set:
+    TIME_ENTRIES_CACHE_PATH = os.getenv("CLICKUP_CACHE_PATH")
+    TIME_ENTRIES_CACHE_TTL = 300  # seconds, for ranges that may still change
+    TIME_ENTRIES_LOCK_WINDOW = datetime.timedelta(days=7)
+
+    def __init__(
+        self,
+        token: str,
+        api_url: str | None = None,
+        retry_total: int = 5,
+        backoff_factor: float = 0.2,
+        max_in_flight: int | None = None,
+    ) -> None:
+        super().__init__(token, api_url, retry_total, backoff_factor, max_in_flight)
+        self._teams_workspaces_cache: dict[str, tuple[float, dict]] = {}
+        self._teams_workspaces_locks: dict[str, threading.Lock] = {}
+
+    def _cached_teams_workspaces(
+        self, token: str | None = None, ttl: int | None = None
+    ) -> dict:
+        """
+        Returns get_authorized_teams_workspaces response, cached per token for 'ttl' \
+            seconds. Only successful responses (with 'teams') are cached. \
+            Concurrent calls for the same token share a single request.
+
+        Args:
+            token (str | None, optional): Token for request authentication. \
+                If None, uses token of an instance. Defaults to None.
+            ttl (int | None, optional): Time to live of a cached response in seconds. \
+                If None, uses TEAMS_WORKSPACES_TTL. Defaults to None.
+        Returns:
+            dict: Returns a copy of the cached response, safe to modify.
+        """
+
+        key = token or self.token
+        cached = self._teams_workspaces_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return copy.deepcopy(cached[1])
+
+        # calls waiting on the lock reuse the response of a call in progress:
+        with self._teams_workspaces_locks.setdefault(key, threading.Lock()):
+            cached = self._teams_workspaces_cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                return copy.deepcopy(cached[1])
+
+            workspaces = self.get_authorized_teams_workspaces(as_json=True, token=token)
+            if "teams" in workspaces:
+                expiry = time.monotonic() + (
+                    self.TEAMS_WORKSPACES_TTL if ttl is None else ttl
+                )
+                self._teams_workspaces_cache[key] = (expiry, copy.deepcopy(workspaces))
+        return workspaces
+
     def request_workspace_ids(
         self, team_id: Any | None = None, token: str | None = None
-    ) -> list | tuple:
+    ) -> list:
         """
         If no 'team_id' - returns a list of workspaces (team_ids) authorized for a token
         owner from get_authorized_teams_workspaces request.
@@ -27,29 +122,116 @@ class ClickUpAdditionalMethods(ClickUpPOSTMethods):
             token (str | None, optional): Token for request authentication. \
                 If None, uses token of an instance. Defaults to None.
         Returns:
-            list | tuple: Returns a list or a tuple of team_ids (workspaces).
+            list: Returns a list of team_ids (workspaces).
         """
 
-        if not team_id:
-            workspaces = self.get_authorized_teams_workspaces(as_json=True, token=token)
-            if not workspaces["teams"]:
+        if team_id is None:
+            # error responses (e.g. for invalid token) come without 'teams':
+            teams_data = self._cached_teams_workspaces(token=token).get("teams")
+            if not teams_data:
                 raise ValueError("No teams (workspaces) found for a given token.")
-            teams = []
-            for team in workspaces["teams"]:
-                teams.append(team["id"])
-        elif isinstance(team_id, (list, tuple)):
-            teams = team_id
-        else:
-            raise TypeError(
-                f"'team_id' must be a list or a tuple, not {type(team_id)}."
+            return [team["id"] for team in teams_data]
+        if isinstance(team_id, (list, tuple)):
+            return list(team_id)
+        raise TypeError(f"'team_id' must be a list or a tuple, not {type(team_id)}.")
+
+    def _is_closed_range(
+        self,
+        end_date: datetime.datetime | list[int] | tuple[int] | None = None,
+    ) -> bool:
+        """
+        Checks if time entries up to 'end_date' can no longer change, i.e. if \
+            'end_date' is older than TIME_ENTRIES_LOCK_WINDOW.
+
+        Args:
+            end_date (datetime.datetime | list[int] | tuple[int] | None, optional): \
+                End of a time search. If None, equals to current date and time. \
+                Defaults to None.
+        Returns:
+            bool: Returns True if the date range is closed.
+        """
+
+        if not end_date:
+            return False
+        lock_date = datetime.datetime.now() - self.TIME_ENTRIES_LOCK_WINDOW
+        return datetime_to_unix_time_in_milliseconds(
+            end_date
+        ) < datetime_to_unix_time_in_milliseconds(lock_date)
+
+    def _cached_time_entries(self, team_id: int, **kwargs) -> dict:
+        """
+        Returns get_time_entries response for a team (workspace), cached on disk \
+            in TIME_ENTRIES_CACHE_PATH. Responses for closed date ranges are cached \
+            indefinitely, other responses for TIME_ENTRIES_CACHE_TTL seconds. \
+            Only successful responses (with 'data') are cached.
+
+        Args:
+            team_id (int): Team ID (Workspace).
+        Returns:
+            dict: Returns response to get_time_entries request.
+        """
+
+        path = self.TIME_ENTRIES_CACHE_PATH
+        if not path:
+            return self.get_time_entries(team_id=team_id, as_json=True, **kwargs)
+
+        key = hashlib.blake2b(
+            json.dumps(
+                [team_id, kwargs.get("token") or self.token, sorted(kwargs.items())],
+                default=str,
+            ).encode()
+        ).hexdigest()
+        with _TIME_ENTRIES_CACHE_LOCK, shelve.open(path) as cache:
+            cached = cache.get(key)
+        if cached and (cached[0] is None or cached[0] > time.time()):
+            return cached[1]
+
+        response = self.get_time_entries(team_id=team_id, as_json=True, **kwargs)
+        if "data" in response:
+            expiry = (
+                None
+                if self._is_closed_range(kwargs.get("end_date"))
+                else time.time() + self.TIME_ENTRIES_CACHE_TTL
             )
-        return teams
+            with _TIME_ENTRIES_CACHE_LOCK, shelve.open(path) as cache:
+                cache[key] = (expiry, response)
+        return response
+
+    def _iter_time_entry_responses(
+        self, team_id: list[int] | tuple[int], **kwargs
+    ) -> Iterator[dict]:
+        """
+        Yields responses from get_time_entries request on each team (workspace), \
+            in the same order as 'team_id'. Requests are sent concurrently from \
+            a thread pool of at most TIME_ENTRIES_MAX_WORKERS threads.
+
+        Args:
+            team_id (list[int] | tuple[int]): Team ID (Workspace).
+        Returns:
+            Iterator[dict]: Yields responses to get_time_entries request.
+        """
+
+        if not team_id:
+            raise AttributeError("'team_id' must be a list or a tuple with ID values.")
+
+        workers = min(self.TIME_ENTRIES_MAX_WORKERS, len(team_id))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for response in executor.map(
+                lambda team: self._cached_time_entries(team_id=team, **kwargs), team_id
+            ):
+                if "data" not in response:
+                    raise ReferenceError(
+                        "Request to access teams failed - team not authorized. "
+                        f"ClickUp API final error message: {response}."
+                    )
+                yield response
 
     def request_time_entries_for_workspace_ids(
         self, team_id: list[int] | tuple[int], **kwargs
     ) -> list:
         """
         Returns a list of responses from get_time_entries request on each team (workspace).
+        Requests for all teams are sent concurrently.
 
         Args:
             team_id (list[int] | tuple[int]): Team ID (Workspace).
@@ -57,20 +239,131 @@ class ClickUpAdditionalMethods(ClickUpPOSTMethods):
             list: Returns a list of responses to get_time_entries request.
         """
 
-        if not team_id:
-            raise AttributeError("'team_id' must be a list or a tuple with ID values.")
+        return list(self._iter_time_entry_responses(team_id, **kwargs))
+
+    def _iter_time_entries(
+        self, team_id: list[int] | tuple[int], **kwargs
+    ) -> Iterator[dict]:
+        """
+        Yields time entries from get_time_entries request on each team (workspace), \
+            one entry at a time. Each response is released once its entries \
+            have been consumed.
+
+        Args:
+            team_id (list[int] | tuple[int]): Team ID (Workspace).
+        Returns:
+            Iterator[dict]: Yields single time entries.
+        """
 
-        responses = []
-        for team in team_id:
-            response = self.get_time_entries(team_id=team, as_json=True, **kwargs)
-            if not "data" in response.keys():
+        for response in self._iter_time_entry_responses(team_id, **kwargs):
+            yield from response["data"]
+
+    def get_all_tasks(self, list_id: int, **kwargs) -> list[dict]:
+        """
+        Returns tasks of a List from all pages of get_tasks response. The first \
+            page is requested alone - if it is not the last page, next pages are \
+            requested concurrently, TASKS_MAX_WORKERS pages at a time, until \
+            the last page is reached.
+
+        Args:
+            list_id (int): ID of a List.
+            **kwargs: Other arguments of get_tasks method (filters, token), \
+                except 'page' and 'as_json'.
+        Raises:
+            ReferenceError: Raises if request for a page failed.
+        Returns:
+            list[dict]: Returns a list of tasks, in the order of pages.
+        """
+
+        def get_page(page: int) -> dict:
+            response = self.get_tasks(list_id, page=page, **kwargs)
+            if "tasks" not in response:
                 raise ReferenceError(
-                    f"Request to access teams failed - team not authorized. "
-                    "ClickUp API final error message: {response}."
+                    f"Request for page {page} of tasks failed. "
+                    f"ClickUp API final error message: {response}."
                 )
-            else:
-                responses.append(response)
-        return responses
+            return response
+
+        def is_last(response: dict) -> bool:
+            return (
+                response.get("last_page", False)
+                or len(response["tasks"]) < self.TASKS_PAGE_SIZE
+            )
+
+        response = get_page(0)
+        tasks = response["tasks"]
+        if is_last(response):
+            return tasks
+
+        first_page = 1
+        with ThreadPoolExecutor(max_workers=self.TASKS_MAX_WORKERS) as executor:
+            while True:
+                pages = range(first_page, first_page + self.TASKS_MAX_WORKERS)
+                for response in executor.map(get_page, pages):
+                    tasks.extend(response["tasks"])
+                    if is_last(response):
+                        return tasks
+                first_page += self.TASKS_MAX_WORKERS
+
+    def _get_comments_concurrently(
+        self, get: Callable[[Any], dict], ids: list | tuple
+    ) -> list[dict]:
+        """
+        Runs 'get' for each id concurrently, from a thread pool of at most \
+            COMMENTS_MAX_WORKERS threads.
+
+        Args:
+            get (Callable[[Any], dict]): Method returning comments of a single object.
+            ids (list | tuple): IDs of objects.
+        Returns:
+            list[dict]: Returns a list of 'get' results, in the same order as 'ids'.
+        """
+
+        if not ids:
+            return []
+        workers = min(self.COMMENTS_MAX_WORKERS, len(ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(get, ids))
+
+    def get_task_comments_many(
+        self, task_ids: list[str] | tuple[str], **kwargs
+    ) -> list[dict]:
+        """
+        Returns responses from get_task_comments request on each task. \
+            Requests for all tasks are sent concurrently.
+
+        Args:
+            task_ids (list[str] | tuple[str]): IDs of tasks.
+            **kwargs: Other arguments of get_task_comments method (e.g. start, \
+                token), except 'as_json'.
+        Returns:
+            list[dict]: Returns a list of responses to get_task_comments request, \
+                in the same order as 'task_ids'.
+        """
+
+        return self._get_comments_concurrently(
+            lambda task_id: self.get_task_comments(task_id, **kwargs), task_ids
+        )
+
+    def get_list_comments_many(
+        self, list_ids: list[int] | tuple[int], **kwargs
+    ) -> list[dict]:
+        """
+        Returns responses from get_list_comments request on each List. \
+            Requests for all Lists are sent concurrently.
+
+        Args:
+            list_ids (list[int] | tuple[int]): IDs of Lists.
+            **kwargs: Other arguments of get_list_comments method (e.g. start, \
+                token), except 'as_json'.
+        Returns:
+            list[dict]: Returns a list of responses to get_list_comments request, \
+                in the same order as 'list_ids'.
+        """
+
+        return self._get_comments_concurrently(
+            lambda list_id: self.get_list_comments(list_id, **kwargs), list_ids
+        )
 
     def user_worktime(
         self,
@@ -125,42 +418,31 @@ class ClickUpAdditionalMethods(ClickUpPOSTMethods):
 
         workspaces = self.request_workspace_ids(team_id=team_id, token=token)
 
-        time_entry_responses = self.request_time_entries_for_workspace_ids(
+        time_entries = self._iter_time_entries(
             workspaces,
-            start_date=start_date,
-            end_date=end_date,
+            start_date=_to_epoch_ms(start_date, month_start=True),
+            end_date=_to_epoch_ms(end_date),
             assignee=assignee,
             token=token,
         )
 
-        duration_per_user = {}
-        for response in time_entry_responses:
-            for task in response["data"]:
-                if task["user"]["username"] in duration_per_user:
-                    if only_billable:
-                        duration_per_user[task["user"]["username"]] += (
-                            int(task["duration"]) if task["billable"] else 0
-                        )
-                    else:
-                        duration_per_user[task["user"]["username"]] += int(
-                            task["duration"]
-                        )
+        duration_per_user: defaultdict[str, int] = defaultdict(int)
+        if only_billable:
+            for task in time_entries:
+                username = task["user"]["username"]
+                if task["billable"]:
+                    duration_per_user[username] += int(task["duration"])
                 else:
-                    if only_billable:
-                        duration_per_user[task["user"]["username"]] = (
-                            int(task["duration"]) if task["billable"] else 0
-                        )
-                    else:
-                        duration_per_user[task["user"]["username"]] = int(
-                            task["duration"]
-                        )
-
-        for user, duration in duration_per_user.items():
-            duration_per_user[user] = str(
-                datetime.timedelta(seconds=int(duration) / 1000)
-            ).split(".")[0]
-
-        return duration_per_user
+                    # user is still listed, with no billable time:
+                    duration_per_user.setdefault(username, 0)
+        else:
+            for task in time_entries:
+                duration_per_user[task["user"]["username"]] += int(task["duration"])
+
+        return {
+            user: unix_time_in_milliseconds_to_duration(duration)
+            for user, duration in duration_per_user.items()
+        }
 
     def user_tasks(
         self,
@@ -210,28 +492,25 @@ class ClickUpAdditionalMethods(ClickUpPOSTMethods):
         workspaces_ids = self.request_workspace_ids(team_id=team_id, token=token)
 
         # for filtering by username and surname instead of user_id:
-        workspaces_data = self.get_authorized_teams_workspaces(token=token)
-        for team in workspaces_data["teams"]:
-            is_user_in_workspace = False
-            for user in team["members"]:
-                if username.casefold() == user["user"]["username"].casefold():
-                    assignee = user["user"][
-                        "id"
-                    ]  # getting user_id from username from workspace
-                    is_user_in_workspace = True
-                    break
-
-        if not is_user_in_workspace:
+        workspaces_data = self._cached_teams_workspaces(token=token)
+        user_ids = {
+            member["user"]["username"].casefold(): member["user"]["id"]
+            for team in workspaces_data["teams"]
+            for member in team["members"]
+        }
+        assignee = user_ids.get(username.casefold())
+
+        if assignee is None:
             raise ValueError(
                 f"User '{username}' not found in workspace list of members. "
                 "Validate 'username' argument or use another token to search "
                 "through different workspaces."
             )
 
-        time_entry_responses = self.request_time_entries_for_workspace_ids(
+        time_entries = self._iter_time_entries(
             workspaces_ids,
-            start_date=start_date,
-            end_date=end_date,
+            start_date=_to_epoch_ms(start_date, month_start=True),
+            end_date=_to_epoch_ms(end_date),
             assignee=assignee,
             custom_task_ids=True,
             token=token,
@@ -239,9 +518,7 @@ class ClickUpAdditionalMethods(ClickUpPOSTMethods):
 
         # all unique tasks by ids (one task can appear many times depending on
         # the number of times tracked):
-        task_ids = []
-        # all time tracked ids for all tasks (each time track has its own id):
-        task_entry_ids = []
+        tasks_by_id: dict[str, dict] = {}
 
         user_tasks = {
             "username": username,
@@ -249,64 +526,48 @@ class ClickUpAdditionalMethods(ClickUpPOSTMethods):
             "tasks": [],
         }
 
-        # if there is more than one workspace to get tasks from, the access to response data
-        # for each workspace must be made separately:
-        for response in time_entry_responses:
-            # accessing response data from request made on get_time_entries on each workspace:
-            if response["data"]:
-                for task in response["data"]:
-                    # increasing time duration for existing task in user_tasks dict
-                    # (task with multiple time entrances):
-                    if task["task"]["id"] in task_ids:
-                        for element in user_tasks["tasks"]:
-                            if task["task"]["id"] == element["task_id"]:
-                                element["duration"] += int(task["duration"])
-                                task_entry_ids.append(task["id"])
-                    # adding a new task to user_tasks dict:
-                    else:
-                        task_entry_ids.append(task["id"])
-                        task_ids.append(task["task"]["id"])
-                        new_task = {}
-                        new_task["task_id"] = (
-                            task["task"]["id"] if "task" in task.keys() else None
-                        )
-                        new_task["custom_id"] = (
-                            task["task"]["custom_id"]
-                            if "task" in task.keys()
-                            and "custom_id" in task["task"].keys()
-                            else None
-                        )
-                        new_task["task_name"] = (
-                            task["task"]["name"] if "task" in task.keys() else None
-                        )
-                        new_task["duration"] = (
-                            int(task["duration"]) if "duration" in task.keys() else None
-                        )
-                        new_task["custom_id"] = (
-                            task["custom_items"]["id"]
-                            if "custom_items" in task.keys()
-                            else None
-                        )
-                        user_tasks["tasks"].append(new_task)
+        # time entries from all workspaces are consumed one by one:
+        for task in time_entries:
+            task_obj = task.get("task") or {}
+            task_id = task_obj.get("id")
+            duration = int(task.get("duration", 0))
+            task_record = tasks_by_id.get(task_id)
+            # increasing time duration for existing task (task with multiple
+            # time entrances):
+            if task_record:
+                task_record["duration"] += duration
+            # adding a new task:
+            else:
+                tasks_by_id[task_id] = {
+                    "task_id": task_id,
+                    "custom_id": task_obj.get("custom_id"),
+                    "task_name": task_obj.get("name"),
+                    "duration": duration,
+                }
+        user_tasks["tasks"] = list(tasks_by_id.values())
 
         # converting Epoch time to datetime for each task:
         for task in user_tasks["tasks"]:
-            task["duration"] = str(
-                datetime.timedelta(seconds=int(task["duration"]) / 1000)
-            ).split(".")[0]
-
-        # DEBUG:
-        # print("✅ data set:", time_entry_responses)
-        # print("✅ task_ids:", task_ids, "list length:", len(task_ids))
-        # print("✅ task_entry_ids:", task_entry_ids, "list length:", len(task_entry_ids))
+            task["duration"] = unix_time_in_milliseconds_to_duration(task["duration"])
 
         return user_tasks
 
+    @staticmethod
+    def _checklist_item_args(
+        item: tuple[str, int] | tuple[str] | str
+    ) -> tuple[str, int | None]:
+        """Returns (name, assignee_id) pair for a checklist item given as a string
+        or as a tuple with item name and optional assignee id."""
+        if isinstance(item, str):
+            return item, None
+        return item[0], item[1] if len(item) > 1 else None
+
     def add_items_to_a_checklist(
         self,
         checklist_id: str,
         items: list[tuple[str, int] | str],
         token: str | None = None,
+        concurrent: bool = False,
     ) -> dict:
         """
         Add many items to a single checklist.
@@ -320,33 +581,31 @@ class ClickUpAdditionalMethods(ClickUpPOSTMethods):
                 Alternatively, type a list of strings of item names without any assignees.
             token (str | None, optional): Token for request authentication. \
                 If None, uses token of an instance. Defaults to None.
+            concurrent (bool, optional): If True, items are created concurrently \
+                (at most CHECKLIST_ITEMS_MAX_WORKERS at a time) and their order \
+                in the checklist is not guaranteed. Defaults to False.
         Returns: dict response.
         """
 
         if isinstance(items, str):
+            items = [items]
+        elif not isinstance(items, list):
+            raise AttributeError("'items' must be a list or a string.")
+
+        def create_item(item: tuple[str, int] | tuple[str] | str) -> None:
+            name, assignee = self._checklist_item_args(item)
             self.create_checklist_item(
-                checklist_id=checklist_id, name=items, token=token
+                checklist_id=checklist_id, name=name, assignee=assignee, token=token
             )
-        elif isinstance(items, list):
-            for item in items:
-                if isinstance(item, tuple):
-                    if len(item) == 2:
-                        self.create_checklist_item(
-                            checklist_id=checklist_id,
-                            name=item[0],
-                            assignee=item[1],
-                            token=token,
-                        )
-                    else:
-                        self.create_checklist_item(
-                            checklist_id=checklist_id, name=item, token=token
-                        )
-                elif isinstance(item, str):
-                    self.create_checklist_item(
-                        checklist_id=checklist_id, name=item, token=token
-                    )
+
+        if concurrent and len(items) > 1:
+            workers = min(self.CHECKLIST_ITEMS_MAX_WORKERS, len(items))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # consuming results to re-raise errors from worker threads:
+                list(executor.map(create_item, items))
         else:
-            raise AttributeError("'items' must be a list or a string.")
+            for item in items:
+                create_item(item)
         return {"status_code": 201, "detail": "Items added to a checklist."}
 
     def post_checklist_with_many_items(
@@ -378,21 +637,16 @@ class ClickUpAdditionalMethods(ClickUpPOSTMethods):
         Returns: dict response.
         """
 
-        if (not task_id and not checklist_id) or (task_id and checklist_id):
-            raise AttributeError(
-                "Either 'task_id' or 'checklist_id' must be set (not both)."
-            )
-        if checklist_name and checklist_id:
-            raise AttributeError(
-                "Set either 'checklist_name' or 'checklist_id', not both."
-            )
-        if (task_id and not checklist_name) or (checklist_name and not task_id):
+        mode = _CHECKLIST_MODES.get(
+            (bool(task_id), bool(checklist_id), bool(checklist_name))
+        )
+        if mode is None:
             raise AttributeError(
-                "For creating new checklist with items, both team_id' "
-                "and 'checklist_name' are required."
+                "Set either 'task_id' and 'checklist_name' to create a new checklist "
+                "or only 'checklist_id' to add items to existing checklist."
             )
 
-        if task_id:
+        if mode == "new":
             checklist = self.create_checklist(task_id, checklist_name, token)
             checklist_id = checklist["checklist"]["id"]
 
@@ -0,0 +1,55 @@
+import threading
+import time
+
+
+class CircuitBreaker:
+    """
+    Closed -> open -> half-open state machine for requests to a single host. \
+        After 'failure_threshold' consecutive failures the circuit opens and \
+        requests are rejected for 'reset_timeout' seconds. Then one probe request \
+        is let through - its success closes the circuit, its failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failure_count = 0
+        self.state = "closed"
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def retry_in(self) -> float:
+        """Returns number of seconds left until the open circuit lets a probe through."""
+        return max(self.reset_timeout - (time.monotonic() - self.opened_at), 0)
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and not self.retry_in():
+                self.state = "half_open"
+                return True
+            return False  # open, or half-open with a probe already in progress
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failure_count = 0
+            self.state = "closed"
+
+    def release_probe(self) -> None:
+        """Releases a half-open probe that failed for a reason unrelated to the host \
+            (e.g. an invalid request) - neither a success nor a failure is counted, \
+            the next request is let through as a new probe."""
+        with self._lock:
+            if self.state == "half_open":
+                self.state = "open"  # reset_timeout has already passed
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failure_count += 1
+            if (
+                self.state == "half_open"
+                or self.failure_count >= self.failure_threshold
+            ):
+                self.state = "open"
+                self.opened_at = time.monotonic()
@@ -1,10 +1,92 @@
-import requests
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import shelve
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+from urllib.parse import urlencode
 
 from .main import ClickUpAPI
 
+_BOOL_STR = ("false", "true")  # query string value of a boolean flag
+_DELETE_CACHE_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_query(items: tuple) -> str:
+    """
+    Encodes query parameters (tuple of key-value pairs) to a query string, \
+        skipping None values as requests does. Cached, as delete queries repeat \
+        a small set of values (custom_task_ids flag, team id).
+    """
+    return urlencode([(key, value) for key, value in items if value is not None])
+
 
 class ClickUpDELETEMethods(ClickUpAPI):
 
+    # concurrent DELETE requests in bulk methods, capped to respect rate limits:
+    BULK_DELETE_MAX_WORKERS = 8
+    # objects deletable in bulk by their id only - kind: single delete method
+    BULK_DELETE_KINDS = {
+        "comment": "delete_comment",
+        "task": "delete_task",
+        "checklist": "delete_checklist",
+    }
+    # on-disk cache of DELETE responses for replayed deletes (opt-in per call),
+    # disabled if no path is set:
+    DELETE_CACHE_PATH = os.getenv("CLICKUP_DELETE_CACHE_PATH")
+    DELETE_CACHE_TTL = 3600  # seconds
+
+    def _do_delete(
+        self,
+        path: str,
+        *,
+        params: dict | None = None,
+        content_type: str = "application/json",
+        token: str | None = None,
+        cache: bool = False,
+    ) -> dict:
+        """
+        Executes DELETE request for a path relative to api_url - shared by all \
+            delete methods. If 'cache' is True and DELETE_CACHE_PATH is set, \
+            final responses (2xx and 404 - object already gone) are kept on disk \
+            for DELETE_CACHE_TTL seconds and repeated deletes return them \
+            without a request.
+
+        Returns: dictionary containing response status code and response message \
+            (empty dictionary if response has no body).
+        """
+
+        url = f"{self._api_url}{path}"
+        if params:
+            query = _encode_query(tuple(params.items()))
+            if query:
+                url = f"{url}?{query}"
+
+        cache_path = self.DELETE_CACHE_PATH if cache else None
+        if cache_path:
+            key = hashlib.blake2b(f"{url} {token or self.token}".encode()).hexdigest()
+            with _DELETE_CACHE_LOCK, shelve.open(cache_path) as deleted:
+                cached = deleted.get(key)
+            if cached and cached[0] > time.time():
+                return cached[1]
+
+        response = self._request(
+            "delete", url, headers=self.header(content_type, token)
+        )
+        # DELETE responses are mostly empty - the body is parsed only if present:
+        message = self.response_json(response) if response.content else {}
+        result = {"status code": response.status_code, "message": message}
+
+        if cache_path and (response.ok or response.status_code == 404):
+            with _DELETE_CACHE_LOCK, shelve.open(cache_path) as deleted:
+                deleted[key] = (time.time() + self.DELETE_CACHE_TTL, result)
+        return result
+
     def delete_comment(
         self,
         comment_id: int,
@@ -21,11 +103,7 @@ class ClickUpDELETEMethods(ClickUpAPI):
         Returns: dictionary containing response status code and response message.
         """
 
-        url = self.api_url + "comment/" + str(comment_id)
-
-        response = requests.delete(url, headers=self.header(token=token))
-        message = {} if response.encoding is None else response.json()
-        return {"status code": response.status_code, "message": message}
+        return self._do_delete(f"comment/{comment_id}", token=token)
 
     def remove_task_from_a_list(
         self,
@@ -47,11 +125,7 @@ class ClickUpDELETEMethods(ClickUpAPI):
         Returns: dictionary containing response status code and response message.
         """
 
-        url = self.api_url + "list/" + str(list_id) + "/task/" + str(task_id)
-
-        response = requests.delete(url, headers=self.header(token=token))
-        message = {} if response.encoding is None else response.json()
-        return {"status code": response.status_code, "message": message}
+        return self._do_delete(f"list/{list_id}/task/{task_id}", token=token)
 
     def delete_task(
         self,
@@ -59,6 +133,7 @@ class ClickUpDELETEMethods(ClickUpAPI):
         custom_task_ids: bool = False,
         team_id: int | None = None,
         token: str | None = None,
+        cache: bool = False,
     ) -> dict:
         """
         Execute DELETE request - delete a task from your Workspace.
@@ -72,27 +147,23 @@ class ClickUpDELETEMethods(ClickUpAPI):
                 parameter is set to True. Defaults to None.
             token (str | None, optional): Token for request authentication. \
                 If None, uses token of an instance. Defaults to None.
+            cache (bool, optional): If True, a repeated delete of the same task \
+                returns the cached response without a request \
+                (see DELETE_CACHE_PATH). Defaults to False.
         Returns: dictionary containing response status code and response message.
         """
 
-        url = self.api_url + "task/" + str(task_id)
-
-        custom_task_ids = "true" if team_id or custom_task_ids else "false"
+        custom_task_ids = _BOOL_STR[bool(team_id or custom_task_ids)]
 
         query = {
             "custom_task_ids": custom_task_ids,
             "team_id": team_id,
         }
 
-        response = requests.delete(
-            url,
-            params=query,
-            headers=self.header(token=token, content_type="application/json"),
+        return self._do_delete(
+            f"task/{task_id}", params=query, token=token, cache=cache
         )
 
-        message = {} if response.encoding is None else response.json()
-        return {"status code": response.status_code, "message": message}
-
     def delete_checklist(self, checklist_id: str, token: str | None = None) -> dict:
         """
         Execute DELETE request - delete a checklist from a task.
@@ -104,11 +175,7 @@ class ClickUpDELETEMethods(ClickUpAPI):
                 If None, uses token of an instance. Defaults to None.
         Returns: dictionary containing response status code and response message.
         """
-        url = self.api_url + "checklist/" + str(checklist_id)
-
-        response = requests.delete(url, headers=self.header(token=token))
-        message = {} if response.encoding is None else response.json()
-        return {"status code": response.status_code, "message": message}
+        return self._do_delete(f"checklist/{checklist_id}", token=token)
 
     def delete_checklist_item(
         self, checklist_id: str, checklist_item_id: str, token: str | None = None
@@ -124,19 +191,10 @@ class ClickUpDELETEMethods(ClickUpAPI):
                 If None, uses token of an instance. Defaults to None.
         Returns: dictionary containing response status code and response message.
         """
-        url = (
-            self.api_url
-            + "checklist/"
-            + str(checklist_id)
-            + "/checklist_item/"
-            + str(checklist_item_id)
-        )
-
-        response = requests.delete(
-            url, headers=self.header(token=token, content_type="appliaction/json")
+        return self._do_delete(
+            f"checklist/{checklist_id}/checklist_item/{checklist_item_id}",
+            token=token,
         )
-        message = {} if response.encoding is None else response.json()
-        return {"status code": response.status_code, "message": message}
 
     def delete_task_link(
         self,
@@ -161,19 +219,15 @@ class ClickUpDELETEMethods(ClickUpAPI):
                 If None, uses token of an instance. Defaults to None.
         Returns: dictionary containing response status code and response message.
         """
-        url = self.api_url + "task/" + str(task_id) + "/link/" + str(links_to)
-
-        custom_task_ids = "true" if team_id or custom_task_ids else "false"
+        custom_task_ids = _BOOL_STR[bool(team_id or custom_task_ids)]
 
         query = {"custom_task_ids": custom_task_ids, "team_id": team_id}
 
-        response = requests.delete(
-            url,
+        return self._do_delete(
+            f"task/{task_id}/link/{links_to}",
             params=query,
-            headers=self.header(token=token, content_type="appliaction/json"),
+            token=token,
         )
-        message = {} if response.encoding is None else response.json()
-        return {"status code": response.status_code, "message": message}
 
     def delete_task_dependency(
         self,
@@ -200,9 +254,7 @@ class ClickUpDELETEMethods(ClickUpAPI):
                 If None, uses token of an instance. Defaults to None.
         Returns: dictionary containing response status code and response message.
         """
-        url = self.api_url + "task/" + str(task_id) + "/dependency"
-
-        custom_task_ids = "true" if team_id or custom_task_ids else "false"
+        custom_task_ids = _BOOL_STR[bool(team_id or custom_task_ids)]
 
         query = {
             "depends_on": depends_on,
@@ -211,10 +263,99 @@ class ClickUpDELETEMethods(ClickUpAPI):
             "team_id": team_id,
         }
 
-        response = requests.delete(
-            url,
+        return self._do_delete(
+            f"task/{task_id}/dependency",
             params=query,
-            headers=self.header(token=token, content_type="appliaction/json"),
+            token=token,
         )
-        message = {} if response.encoding is None else response.json()
-        return {"status code": response.status_code, "message": message}
+
+    def _bulk_delete(self, delete: Callable[[Any], dict], ids: list | tuple) -> list:
+        """
+        Runs 'delete' for each id concurrently, at most BULK_DELETE_MAX_WORKERS \
+            requests at a time. Requests share pooled connections of the session.
+
+        Args:
+            delete (Callable[[Any], dict]): Method deleting a single object.
+            ids (list | tuple): IDs of objects to delete.
+        Returns:
+            list: Returns a list of 'delete' results, in the same order as 'ids'.
+        """
+
+        if not ids:
+            return []
+        workers = min(self.BULK_DELETE_MAX_WORKERS, len(ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(delete, ids))
+
+    def bulk_delete_tasks(
+        self,
+        task_ids: list[str] | tuple[str],
+        custom_task_ids: bool = False,
+        team_id: int | None = None,
+        token: str | None = None,
+    ) -> list[dict]:
+        """
+        Execute DELETE requests - delete many tasks from your Workspace concurrently.
+
+        Args:
+            task_ids (list[str] | tuple[str])
+            custom_task_ids (bool): If you want to reference tasks by their \
+                custom task IDs, this value must be set to True. Defaults to False.
+            team_id (int | None, optional): Only used when the custom_task_ids \
+                parameter is set to True. Defaults to None.
+            token (str | None, optional): Token for request authentication. \
+                If None, uses token of an instance. Defaults to None.
+        Returns: list of dictionaries containing response status code and response \
+            message for each task, in the same order as 'task_ids'.
+        """
+
+        return self._bulk_delete(
+            lambda task_id: self.delete_task(task_id, custom_task_ids, team_id, token),
+            task_ids,
+        )
+
+    def bulk_delete_comments(
+        self,
+        comment_ids: list[int] | tuple[int],
+        token: str | None = None,
+    ) -> list[dict]:
+        """
+        Execute DELETE requests - delete many comments concurrently.
+
+        Args:
+            comment_ids (list[int] | tuple[int])
+            token (str | None, optional): Token for request authentication. \
+                If None, uses token of an instance. Defaults to None.
+        Returns: list of dictionaries containing response status code and response \
+            message for each comment, in the same order as 'comment_ids'.
+        """
+
+        return self.bulk_delete("comment", comment_ids, token)
+
+    def bulk_delete(
+        self, kind: str, ids: list | tuple, token: str | None = None
+    ) -> list[dict]:
+        """
+        Execute DELETE requests - delete many objects of one kind concurrently. \
+            Acceptable kinds are keys of BULK_DELETE_KINDS ('comment', 'task', \
+            'checklist').
+
+        Args:
+            kind (str): Kind of objects to delete.
+            ids (list | tuple): IDs of objects to delete.
+            token (str | None, optional): Token for request authentication. \
+                If None, uses token of an instance. Defaults to None.
+        Raises:
+            ValueError: Raises if kind is not acceptable.
+        Returns: list of dictionaries containing response status code and response \
+            message for each object, in the same order as 'ids'.
+        """
+
+        method_name = self.BULK_DELETE_KINDS.get(kind)
+        if method_name is None:
+            raise ValueError(
+                f"Invalid kind: '{kind}'. Acceptable kinds are: "
+                f"{', '.join(self.BULK_DELETE_KINDS)}."
+            )
+        delete = getattr(self, method_name)
+        return self._bulk_delete(lambda object_id: delete(object_id, token=token), ids)
@@ -17,6 +17,32 @@ load_dotenv()
 class ClickUpGETMethods(ClickUpAPI):
     """Methods for GET requests in ClickUp API."""
 
+    _BOOL_MAP = {True: "true", False: "false"}
+    # get_tasks query parameters sent as "true"/"false" and as unix time:
+    _TASK_BOOL_PARAMS = (
+        "archived",
+        "include_markdown_description",
+        "reverse",
+        "include_closed",
+    )
+    _TASK_ORDER_BY = frozenset(("id", "created", "updated", "due_date"))
+    _TASK_DATE_PARAMS = (
+        "due_date_gt",
+        "due_date_lt",
+        "date_created_gt",
+        "date_created_lt",
+        "date_updated_gt",
+        "date_updated_lt",
+        "date_done_gt",
+        "date_done_lt",
+    )
+    # comment endpoints relative to api_url, by kind of commented object:
+    _COMMENT_ENDPOINTS = {
+        "task": "task/{}/comment",
+        "list": "list/{}/comment",
+        "view": "view/{}/comment",
+    }
+
     # def __init__(self, token: str, api_url: str | None = None) -> None:
     #     super().__init__(token, api_url)
 
@@ -37,10 +63,10 @@ class ClickUpGETMethods(ClickUpAPI):
                 or as a JSON dictionary.
         """
 
-        url = self.api_url + "user/"
+        url = f"{self._api_url}user/"
 
-        response = requests.get(url, headers=self.header(token=token))
-        return response.json() if as_json else response
+        response = self._request("get", url, headers=self.header(token=token))
+        return self.response_json(response) if as_json else response
 
     def get_authorized_teams_workspaces(
         self, as_json: bool = True, token: str | None = None
@@ -58,10 +84,10 @@ class ClickUpGETMethods(ClickUpAPI):
                 or as a JSON dictionary.
         """
 
-        url = self.api_url + "team/"
+        url = f"{self._api_url}team/"
 
-        response = requests.get(url, headers=self.header(token=token))
-        return response.json() if as_json else response
+        response = self._request("get", url, headers=self.header(token=token))
+        return self.response_json(response) if as_json else response
 
     def get_teams(
         self,
@@ -87,12 +113,14 @@ class ClickUpGETMethods(ClickUpAPI):
                 or as a JSON dictionary.
         """
 
-        url = self.api_url + "group"
+        url = f"{self._api_url}group"
 
         query = {"team_id": team_id, "group_ids": group_ids}
 
-        response = requests.get(url, headers=self.header(token=token), params=query)
-        return response.json() if as_json else response
+        response = self._request(
+            "get", url, headers=self.header(token=token), params=query
+        )
+        return self.response_json(response) if as_json else response
 
     def get_spaces(
         self, team_id: int, as_json: bool = True, token: str | None = None
@@ -112,10 +140,10 @@ class ClickUpGETMethods(ClickUpAPI):
                 or as a JSON dictionary.
         """
 
-        url = self.api_url + "team/" + str(team_id) + "/space"
+        url = f"{self._api_url}team/{team_id}/space"
 
-        response = requests.get(url, headers=self.header(token=token))
-        return response.json() if as_json else response
+        response = self._request("get", url, headers=self.header(token=token))
+        return self.response_json(response) if as_json else response
 
     def get_space(
         self, space_id: int, as_json: bool = True, token: str | None = None
@@ -135,10 +163,10 @@ class ClickUpGETMethods(ClickUpAPI):
                 or as a JSON dictionary.
         """
 
-        url = self.api_url + "space/" + str(space_id)
+        url = f"{self._api_url}space/{space_id}"
 
-        response = requests.get(url, headers=self.header(token=token))
-        return response.json() if as_json else response
+        response = self._request("get", url, headers=self.header(token=token))
+        return self.response_json(response) if as_json else response
 
     def get_folders(
         self,
@@ -164,14 +192,16 @@ class ClickUpGETMethods(ClickUpAPI):
                 or as a JSON dictionary.
         """
 
-        url = self.api_url + "space/" + str(space_id) + "/folder"
+        url = f"{self._api_url}space/{space_id}/folder"
 
         query = {
-            "archived": "true" if check_boolean(archived) else "false",
+            "archived": self._BOOL_MAP[check_boolean(archived)],
         }
 
-        response = requests.get(url, headers=self.header(token=token), params=query)
-        return response.json() if as_json else response
+        response = self._request(
+            "get", url, headers=self.header(token=token), params=query
+        )
+        return self.response_json(response) if as_json else response
 
     def get_folder(
         self,
@@ -194,10 +224,10 @@ class ClickUpGETMethods(ClickUpAPI):
                 or as a JSON dictionary.
         """
 
-        url = self.api_url + "folder/" + str(folder_id)
+        url = f"{self._api_url}folder/{folder_id}"
 
-        response = requests.get(url, headers=self.header(token=token))
-        return response.json() if as_json else response
+        response = self._request("get", url, headers=self.header(token=token))
+        return self.response_json(response) if as_json else response
 
     def get_lists(
         self,
@@ -223,14 +253,16 @@ class ClickUpGETMethods(ClickUpAPI):
                 or as a JSON dictionary.
         """
 
-        url = self.api_url + "folder/" + str(folder_id) + "/list"
+        url = f"{self._api_url}folder/{folder_id}/list"
 
         query = {
-            "archived": "true" if archived else "false",
+            "archived": self._BOOL_MAP[bool(archived)],
         }
 
-        response = requests.get(url, headers=self.header(token=token), params=query)
-        return response.json() if as_json else response
+        response = self._request(
+            "get", url, headers=self.header(token=token), params=query
+        )
+        return self.response_json(response) if as_json else response
 
     def get_list(
         self,
@@ -253,10 +285,10 @@ class ClickUpGETMethods(ClickUpAPI):
                 or as a JSON dictionary.
         """
 
-        url = self.api_url + "list/" + str(list_id)
+        url = f"{self._api_url}list/{list_id}"
 
-        response = requests.get(url, headers=self.header(token=token))
-        return response.json() if as_json else response
+        response = self._request("get", url, headers=self.header(token=token))
+        return self.response_json(response) if as_json else response
 
     def get_folderless_lists(
         self,
@@ -282,14 +314,16 @@ class ClickUpGETMethods(ClickUpAPI):
                 or as a JSON dictionary.
         """
 
-        url = self.api_url + "space/" + str(space_id) + "/list"
+        url = f"{self._api_url}space/{space_id}/list"
 
         query = {
-            "archived": "true" if archived else "false",
+            "archived": self._BOOL_MAP[bool(archived)],
         }
 
-        response = requests.get(url, headers=self.header(token=token), params=query)
-        return response.json() if as_json else response
+        response = self._request(
+            "get", url, headers=self.header(token=token), params=query
+        )
+        return self.response_json(response) if as_json else response
 
     def get_tasks(
         self,
@@ -332,6 +366,7 @@ class ClickUpGETMethods(ClickUpAPI):
         custom_items: list[int] | None = None,
         as_json: bool = True,
         token: str | None = None,
+        stream: bool = False,
     ) -> dict | requests.Response:
         """
         Execute GET request to view Tasks in a List. Responses are limited to 100 tasks per page.
@@ -420,16 +455,19 @@ class ClickUpGETMethods(ClickUpAPI):
                 Defaults to True.
             token (str | None, optional): Token for request authentication. \
                 If None, uses token of an instance. Defaults to None.
+            stream (bool, optional): If True and as_json is False, response body \
+                is not downloaded until read by the caller (e.g. with \
+                iter_content). Defaults to False.
         Returns:
             dict | Any: Returns response either as a class 'requests.models.Response' \
                 or as a JSON dictionary.
         """
 
-        url = self.api_url + "list/" + str(list_id) + "/task"
+        url = f"{self._api_url}list/{list_id}/task"
 
         if not isinstance(order_by, str):
             raise TypeError("Invalid 'order_by' type. 'order_by' must be a string.")
-        if order_by not in ["id", "created", "updated", "due_date"]:
+        if order_by not in self._TASK_ORDER_BY:
             raise ValueError(
                 "Invalid 'order_by' field choice. Allowed choices are: "
                 "'id', 'created', 'updated', 'due_date'."
@@ -441,66 +479,41 @@ class ClickUpGETMethods(ClickUpAPI):
             )
 
         query = {
-            "archived": "true" if check_boolean(archived) else "false",
-            "include_markdown_description": (
-                "true" if check_boolean(include_markdown_description) else "false"
-            ),
             "page": page,
             "order_by": order_by,
-            "reverse": "true" if check_boolean(reverse) else "false",
             "subtasks": "true" if check_boolean(subtasks) else None,
             "statuses": check_and_adjust_list_length(statuses),
-            "include_closed": "true" if check_boolean(include_closed) else "false",
             "assignees": check_and_adjust_list_length(assignees),
             "tags": check_and_adjust_list_length(tags),
-            "due_date_gt": (
-                datetime_to_unix_time_in_milliseconds(due_date_gt)
-                if due_date_gt
-                else due_date_gt
-            ),
-            "due_date_lt": (
-                datetime_to_unix_time_in_milliseconds(due_date_lt)
-                if due_date_lt
-                else due_date_lt
-            ),
-            "date_created_gt": (
-                datetime_to_unix_time_in_milliseconds(date_created_gt)
-                if date_created_gt
-                else date_created_gt
-            ),
-            "date_created_lt": (
-                datetime_to_unix_time_in_milliseconds(date_created_lt)
-                if date_created_lt
-                else date_created_lt
-            ),
-            "date_updated_gt": (
-                datetime_to_unix_time_in_milliseconds(date_updated_gt)
-                if date_updated_gt
-                else date_updated_gt
-            ),
-            "date_updated_lt": (
-                datetime_to_unix_time_in_milliseconds(date_updated_lt)
-                if date_updated_lt
-                else date_updated_lt
-            ),
-            "date_done_gt": (
-                datetime_to_unix_time_in_milliseconds(date_done_gt)
-                if date_done_gt
-                else date_done_gt
-            ),
-            "date_done_lt": (
-                datetime_to_unix_time_in_milliseconds(date_done_lt)
-                if date_done_lt
-                else date_done_lt
-            ),
-            "custom_fields": custom_fields,
-            "custom_items": (
-                check_integer_list(custom_items) if custom_items else custom_items
-            ),
         }
+        flags = (archived, include_markdown_description, reverse, include_closed)
+        query.update(
+            (key, self._BOOL_MAP[check_boolean(flag)])
+            for key, flag in zip(self._TASK_BOOL_PARAMS, flags)
+        )
+        dates = (
+            due_date_gt,
+            due_date_lt,
+            date_created_gt,
+            date_created_lt,
+            date_updated_gt,
+            date_updated_lt,
+            date_done_gt,
+            date_done_lt,
+        )
+        query.update(
+            (key, datetime_to_unix_time_in_milliseconds(date))
+            for key, date in zip(self._TASK_DATE_PARAMS, dates)
+            if date
+        )
+        if custom_items:
+            check_integer_list(custom_items)
+            query["custom_items"] = custom_items
 
-        response = requests.get(url, headers=self.header(token=token), params=query)
-        return response.json() if as_json else response
+        response = self._request(
+            "get", url, headers=self.header(token=token), params=query, stream=stream
+        )
+        return self.response_json(response) if as_json else response
 
     def get_task(
         self,
@@ -536,23 +549,23 @@ class ClickUpGETMethods(ClickUpAPI):
                 or as a JSON dictionary.
         """
 
-        url = self.api_url + "task/" + str(task_id)
+        url = f"{self._api_url}task/{task_id}"
 
-        custom_task_ids = "true" if team_id or custom_task_ids else "false"
+        custom_task_ids = self._BOOL_MAP[bool(team_id or custom_task_ids)]
 
         query = {
             "custom_task_ids": custom_task_ids,
             "team_id": team_id,
-            "include_subtasks": (
-                "true" if check_boolean(include_subtasks) else "false"
-            ),
-            "include_markdown_description": (
-                "true" if check_boolean(include_markdown_description) else "false"
-            ),
+            "include_subtasks": self._BOOL_MAP[check_boolean(include_subtasks)],
+            "include_markdown_description": self._BOOL_MAP[
+                check_boolean(include_markdown_description)
+            ],
         }
 
-        response = requests.get(url, headers=self.header(token=token), params=query)
-        return response.json() if as_json else response
+        response = self._request(
+            "get", url, headers=self.header(token=token), params=query
+        )
+        return self.response_json(response) if as_json else response
 
     def get_user(
         self, team_id: int, user_id: int, as_json: bool = True, token: str | None = None
@@ -574,19 +587,19 @@ class ClickUpGETMethods(ClickUpAPI):
                 or as a JSON dictionary.
         """
 
-        url = self.api_url + "team/" + str(team_id) + "/user/" + str(user_id)
+        url = f"{self._api_url}team/{team_id}/user/{user_id}"
 
-        response = requests.get(url, headers=self.header(token=token))
-        return response.json() if as_json else response
+        response = self._request("get", url, headers=self.header(token=token))
+        return self.response_json(response) if as_json else response
 
     def get_time_entries(
         self,
         team_id: int,
         start_date: (
-            datetime.datetime | list[int, int, int] | tuple[int, int, int] | None
+            datetime.datetime | list[int, int, int] | tuple[int, int, int] | int | None
         ) = None,
         end_date: (
-            datetime.datetime | list[int, int, int] | tuple[int, int, int] | None
+            datetime.datetime | list[int, int, int] | tuple[int, int, int] | int | None
         ) = None,
         assignee: int | list[int] | tuple[int] | None = None,
         include_task_tags: bool = False,
@@ -599,6 +612,7 @@ class ClickUpGETMethods(ClickUpAPI):
         query_team_id: int | None = None,
         as_json: bool = True,
         token: str | None = None,
+        stream: bool = False,
     ) -> dict | requests.Response:
         """
         Execute GET request to view time entries filtered by start and end date.
@@ -614,18 +628,18 @@ class ClickUpGETMethods(ClickUpAPI):
 
         Args:
             team_id (int): Team ID (Workspace).
-            start_date (datetime.datetime | list[int] | tuple[int] | None, optional): \
+            start_date (datetime.datetime | list[int] | tuple[int] | int | None, optional): \
                 Sets beginning of a time search. If None, equals to the beginning of \
                 the current month. Use datetime.datetime() to set a start_date. \
                 Alternatively type start_date as a list or a tuple of integer values \
-                in the following order: (year, month, day[, hour, minute, second]). \
-                Defaults to None.
-            end_date (datetime.datetime | list[int] | tuple[int] | None, optional): \
+                in the following order: (year, month, day[, hour, minute, second]) \
+                or as unix time in milliseconds (int). Defaults to None.
+            end_date (datetime.datetime | list[int] | tuple[int] | int | None, optional): \
                 Sets end of a time search. If None, equals to current date and time. \
                 Use datetime.datetime() to set a end_date. \
                 Alternatively type end_date as a list or a tuple of integer values \
-                in the following order: (year, month, day[, hour, minute, second]). \
-                Defaults to None.
+                in the following order: (year, month, day[, hour, minute, second]) \
+                or as unix time in milliseconds (int). Defaults to None.
             assignee (int | list[int] | tuple[int] | None, optional): \
                 Filter time entries by user_id. Provide the user_id as an integer. \
                 For multiple assignees, use list or tuple with user_id numbers. \
@@ -651,20 +665,24 @@ class ClickUpGETMethods(ClickUpAPI):
                 Defaults to True.
             token (str | None, optional): Token for request authentication. \
                 If None, uses token of an instance. Defaults to None.
+            stream (bool, optional): If True and as_json is False, response body \
+                is not downloaded until read by the caller (e.g. with \
+                iter_content). Defaults to False.
         Returns:
             dict | Any: Returns response either as a class 'requests.models.Response' \
                 or as a JSON dictionary.
         """
 
-        url = self.api_url + "team/" + str(team_id) + "/time_entries"
+        url = f"{self._api_url}team/{team_id}/time_entries"
 
         if start_date:
             start_date = datetime_to_unix_time_in_milliseconds(start_date)
         else:
+            # beginning of the current month - as a date sequence, its conversion
+            # is cached:
+            today = datetime.date.today()
             start_date = datetime_to_unix_time_in_milliseconds(
-                datetime.datetime(
-                    datetime.date.today().year, datetime.date.today().month, 1
-                )
+                (today.year, today.month, 1)
             )
         if end_date:
             end_date = datetime_to_unix_time_in_milliseconds(end_date)
@@ -690,22 +708,20 @@ class ClickUpGETMethods(ClickUpAPI):
             if isinstance(assignee, int):
                 user_ids = assignee
             else:
-                user_ids = ",".join(str(element) for element in assignee)
+                user_ids = ",".join(map(str, assignee))
 
-        custom_task_ids = (
-            "true" if (query_team_id or check_boolean(custom_task_ids)) else "false"
-        )
+        custom_task_ids = self._BOOL_MAP[
+            bool(query_team_id or check_boolean(custom_task_ids))
+        ]
 
         query = {
             "start_date": start_date,
             "end_date": end_date,
             "assignee": assignee if not assignee else str(user_ids),
-            "include_task_tags": (
-                "true" if check_boolean(include_task_tags) else "false"
-            ),
-            "include_location_names": (
-                "true" if check_boolean(include_location_names) else "false"
-            ),
+            "include_task_tags": self._BOOL_MAP[check_boolean(include_task_tags)],
+            "include_location_names": self._BOOL_MAP[
+                check_boolean(include_location_names)
+            ],
             "space_id": space_id,
             "folder_id": folder_id,
             "list_id": list_id,
@@ -714,12 +730,60 @@ class ClickUpGETMethods(ClickUpAPI):
             "team_id": query_team_id,
         }
 
-        response = requests.get(
+        response = self._request(
+            "get",
             url,
             headers=self.header(content_type="application/json", token=token),
             params=query,
+            stream=stream,
+        )
+        return self.response_json(response) if as_json else response
+
+    def _get_comments(
+        self,
+        kind: str,
+        obj_id: str | int,
+        *,
+        start: (
+            datetime.datetime | list[int, int, int] | tuple[int, int, int] | None
+        ) = None,
+        start_id: str | None = None,
+        extra: dict | None = None,
+        as_json: bool = True,
+        token: str | None = None,
+    ) -> dict | requests.Response:
+        """
+        Executes GET request for comments of a task, a List or a Chat view - \
+            shared by all comment getters.
+
+        Args:
+            kind (str): Kind of commented object, a key of _COMMENT_ENDPOINTS.
+            obj_id (str | int): ID of a commented object.
+            start (datetime.datetime | list[int] | tuple[int] | None, optional): \
+                The date of comment. Defaults to None.
+            start_id (str | None, optional): Comment ID. Defaults to None.
+            extra (dict | None, optional): Additional query parameters. \
+                Defaults to None.
+            as_json (bool, optional): If True, returns response as a JSON type. \
+                Defaults to True.
+            token (str | None, optional): Token for request authentication. \
+                If None, uses token of an instance. Defaults to None.
+        Returns:
+            dict | Any: Returns response either as a class 'requests.models.Response' \
+                or as a JSON dictionary.
+        """
+
+        url = f"{self._api_url}{self._COMMENT_ENDPOINTS[kind].format(obj_id)}"
+
+        if start:
+            start = datetime_to_unix_time_in_milliseconds(start)
+
+        query = {"start": start, "start_id": start_id, **(extra or {})}
+
+        response = self._request(
+            "get", url, headers=self.header(token=token), params=query
         )
-        return response.json() if as_json else response
+        return self.response_json(response) if as_json else response
 
     def get_task_comments(
         self,
@@ -762,22 +826,20 @@ class ClickUpGETMethods(ClickUpAPI):
                 or as a JSON dictionary.
         """
 
-        url = self.api_url + "task/" + str(task_id) + "/comment"
-
-        if start:
-            start = datetime_to_unix_time_in_milliseconds(start)
-
-        query = {
-            "custom_task_ids": (
-                "true" if check_boolean(custom_task_ids) or team_id else "false"
-            ),
-            "team_id": team_id,
-            "start": start,
-            "start_id": start_id,
-        }
-
-        response = requests.get(url, headers=self.header(token=token), params=query)
-        return response.json() if as_json else response
+        return self._get_comments(
+            "task",
+            task_id,
+            start=start,
+            start_id=start_id,
+            extra={
+                "custom_task_ids": self._BOOL_MAP[
+                    bool(check_boolean(custom_task_ids) or team_id)
+                ],
+                "team_id": team_id,
+            },
+            as_json=as_json,
+            token=token,
+        )
 
     def get_list_comments(
         self,
@@ -814,18 +876,14 @@ class ClickUpGETMethods(ClickUpAPI):
                 or as a JSON dictionary.
         """
 
-        url = self.api_url + "list/" + str(list_id) + "/comment"
-
-        if start:
-            start = datetime_to_unix_time_in_milliseconds(start)
-
-        query = {
-            "start": start,
-            "start_id": start_id,
-        }
-
-        response = requests.get(url, headers=self.header(token=token), params=query)
-        return response.json() if as_json else response
+        return self._get_comments(
+            "list",
+            list_id,
+            start=start,
+            start_id=start_id,
+            as_json=as_json,
+            token=token,
+        )
 
     def get_chat_view_comments(
         self,
@@ -862,18 +920,14 @@ class ClickUpGETMethods(ClickUpAPI):
                 or as a JSON dictionary.
         """
 
-        url = self.api_url + "view/" + str(view_id) + "/comment"
-
-        if start:
-            start = datetime_to_unix_time_in_milliseconds(start)
-
-        query = {
-            "start": start,
-            "start_id": start_id,
-        }
-
-        response = requests.get(url, headers=self.header(token=token), params=query)
-        return response.json() if as_json else response
+        return self._get_comments(
+            "view",
+            view_id,
+            start=start,
+            start_id=start_id,
+            as_json=as_json,
+            token=token,
+        )
 
     def get_custom_task_types(
         self, team_id: str, as_json: bool = True, token: str | None = None
@@ -893,10 +947,10 @@ class ClickUpGETMethods(ClickUpAPI):
                 or as a JSON dictionary.
         """
 
-        url = self.api_url + "team/" + str(team_id) + "/custom_item"
+        url = f"{self._api_url}team/{team_id}/custom_item"
 
-        response = requests.get(url, headers=self.header(token=token))
-        return response.json() if as_json else response
+        response = self._request("get", url, headers=self.header(token=token))
+        return self.response_json(response) if as_json else response
 
     def get_accessible_custom_fields(
         self, list_id: str, as_json: bool = True, token: str | None = None
@@ -916,9 +970,11 @@ class ClickUpGETMethods(ClickUpAPI):
                 or as a JSON dictionary.
         """
 
-        url = self.api_url + "list/" + str(list_id) + "/field"
+        url = f"{self._api_url}list/{list_id}/field"
 
-        response = requests.get(
-            url, headers=self.header(content_type="application/json", token=token)
+        response = self._request(
+            "get",
+            url,
+            headers=self.header(content_type="application/json", token=token),
         )
-        return response.json() if as_json else response
+        return self.response_json(response) if as_json else response
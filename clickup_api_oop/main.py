@@ -1,16 +1,46 @@
+from __future__ import annotations
+
+import functools
+import threading
+from urllib.parse import urlparse
+
+import orjson
+import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
+from clickup_api.exceptions import CircuitOpenError
 from clickup_api.handlers import check_token, is_url
 
+from .circuit_breaker import CircuitBreaker
 from .enums import ClickupActions
 
 load_dotenv()
 
 
+@functools.lru_cache(maxsize=16)
+def _token_header(token: str, content_type: str) -> dict[str, str]:
+    """Builds request header for a per-call token - cached, as callers tend to reuse
+    a handful of tokens."""
+    return {"Authorization": token, "Content-Type": content_type}
+
+
 class ClickUpAPI:
     """A class to handle ClickUp API."""
 
     _API_DEFAULT_URL = "https://app.clickup.com/api/v2/"
+    POOL_CONNECTIONS = 32
+    POOL_MAXSIZE = 64
+    # transient errors retried by the session (idempotent requests only):
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    RETRY_METHODS = frozenset(("GET", "DELETE"))
+    RETRY_BACKOFF_JITTER = 0.1  # seconds
+    RETRY_BACKOFF_MAX = 10  # seconds
+    REQUEST_TIMEOUT = (5.0, 30.0)  # (connect, read) seconds
+    MAX_IN_FLIGHT = 32  # concurrent session requests per instance
+    CIRCUIT_FAILURE_THRESHOLD = 5
+    CIRCUIT_RESET_TIMEOUT = 30  # seconds
     available_statuses = [
         "nowe",
         "w trakcie",
@@ -20,7 +50,14 @@ class ClickUpAPI:
         "zamknięte",
     ]
 
-    def __init__(self, token: str, api_url: str | None = None) -> None:
+    def __init__(
+        self,
+        token: str,
+        api_url: str | None = None,
+        retry_total: int = 5,
+        backoff_factor: float = 0.2,
+        max_in_flight: int | None = None,
+    ) -> None:
         """Constructs attributes for authorization in ClickUp API and validates url address.
 
         Args:
@@ -29,6 +66,15 @@ class ClickUpAPI:
             clickup_api_url (str, optional):
                 Official URL address for ClickUp API.
                 If None, defaults to "https://app.clickup.com/api/v2/".
+            retry_total (int, optional):
+                Maximum number of retries of a failed GET or DELETE request.
+                Defaults to 5.
+            backoff_factor (float, optional):
+                Base of exponential backoff between retries, in seconds.
+                Defaults to 0.2.
+            max_in_flight (int | None, optional):
+                Maximum number of concurrent requests sent through the session.
+                If None, defaults to MAX_IN_FLIGHT.
         Raises:
             ValueError: Raises Invalid URL address.
         Returns:
@@ -37,6 +83,93 @@ class ClickUpAPI:
 
         self.token = token
         self.api_url = api_url
+        # one session per instance - connections to ClickUp API are kept alive
+        # and reused between requests (GET and DELETE requests):
+        self._session = requests.Session()
+        # bulkhead - threads sharing an instance wait for a free slot instead of
+        # exhausting the connection pool:
+        self._bulkhead = threading.BoundedSemaphore(max_in_flight or self.MAX_IN_FLIGHT)
+        self._circuit_breakers: dict[str, CircuitBreaker] = {}
+        # 'Retry-After' header of 429 responses is respected:
+        retry = Retry(
+            total=retry_total,
+            backoff_factor=backoff_factor,
+            backoff_jitter=self.RETRY_BACKOFF_JITTER,
+            backoff_max=self.RETRY_BACKOFF_MAX,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=self.RETRY_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=self.POOL_CONNECTIONS,
+                pool_maxsize=self.POOL_MAXSIZE,
+                max_retries=retry,
+            ),
+        )
+
+    def __enter__(self) -> ClickUpAPI:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """Session shared by requests of the instance - e.g. to mount other adapters."""
+        return self._session
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Sends request ('get' or 'delete') through the session and a circuit breaker
+        of the url host. Connection errors, timeouts and 5xx responses count as
+        failures. Requests time out after REQUEST_TIMEOUT (connect, read) seconds
+        and wait for a free bulkhead slot (see max_in_flight). Query parameters
+        with None values are dropped.
+
+        Raises:
+            CircuitOpenError: Raises if the host circuit is open (request is not sent).
+        Returns:
+            requests.Response: Response to the request.
+        """
+
+        host = urlparse(url).netloc
+        breaker = self._circuit_breakers.get(host)
+        if breaker is None:
+            breaker = self._circuit_breakers.setdefault(
+                host,
+                CircuitBreaker(
+                    self.CIRCUIT_FAILURE_THRESHOLD, self.CIRCUIT_RESET_TIMEOUT
+                ),
+            )
+        if not breaker.allow_request():
+            raise CircuitOpenError(host, breaker.retry_in())
+        kwargs.setdefault("timeout", self.REQUEST_TIMEOUT)
+        params = kwargs.get("params")
+        if params:
+            # empty (None) query parameters are not sent:
+            kwargs["params"] = {
+                key: value for key, value in params.items() if value is not None
+            }
+        try:
+            with self._bulkhead:
+                response = getattr(self._session, method)(url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            breaker.record_failure()
+            raise
+        except Exception:
+            breaker.release_probe()  # not an outage - counts neither way
+            raise
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    def close(self) -> None:
+        """Closes the session and its pooled connections."""
+        self._session.close()
 
     def __repr__(self) -> str:
         """Class representation."""
@@ -68,6 +201,8 @@ class ClickUpAPI:
         """Sets a new token."""
         check_token(new_token)
         self._token = str(new_token)
+        # headers built for the previous token are no longer valid:
+        self._default_headers: dict[str, dict[str, str]] = {}
 
     @property
     def api_url(self) -> str:
@@ -104,9 +239,20 @@ class ClickUpAPI:
         """
 
         if not token:
-            api_key = str(self._token)
-        else:
-            check_token(token)
-            api_key = str(token)
-        request_header = {"Authorization": api_key, "Content-Type": content_type}
-        return request_header
+            # header for instance token is built once per content type:
+            request_header = self._default_headers.get(content_type)
+            if request_header is None:
+                request_header = {
+                    "Authorization": str(self._token),
+                    "Content-Type": content_type,
+                }
+                self._default_headers[content_type] = request_header
+            return request_header
+        check_token(token)
+        return _token_header(token, content_type)
+
+    @staticmethod
+    def response_json(response: requests.Response) -> dict:
+        """Decodes response body with orjson - faster than response.json() for large
+        responses (e.g. time entries)."""
+        return orjson.loads(response.content)
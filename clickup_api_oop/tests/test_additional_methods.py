@@ -1,28 +1,360 @@
+import asyncio
+import datetime
+import io
+import os
+import tempfile
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from unittest.mock import patch
 
 from dotenv import load_dotenv
+from parameterized import parameterized
+from urllib3 import HTTPResponse
 
 from clickup_api_oop.additional_methods import ClickUpAdditionalMethods
 
 load_dotenv()
 
 
-# class TestClickUpAdditionalMethods(unittest.TestCase):
+def time_entries_response(team_id: int, **kwargs) -> dict:
+    return {"data": [{"id": f"entry-{team_id}", "duration": "60000"}]}
 
-#     def setUp():
-#         pass
 
-#     def test_request_workspace_ids(self):
-#         pass
+class TestClickUpAdditionalMethods(unittest.TestCase):
 
-#     def test_request_time_entries_for_workspace_ids(self):
-#         pass
+    def setUp(self):
+        self.api = ClickUpAdditionalMethods(token="TokenRandomCode123")
 
-#     def test_user_worktime(self):
-#         pass
+    @patch.object(ClickUpAdditionalMethods, "get_authorized_teams_workspaces")
+    def test_cached_teams_workspaces_reuses_response(self, mock_request):
+        mock_request.return_value = {"teams": [{"id": "1", "members": []}]}
+        first = self.api._cached_teams_workspaces()
+        first["teams"].clear()
+        second = self.api._cached_teams_workspaces()
+        self.assertEqual(second, {"teams": [{"id": "1", "members": []}]})
+        mock_request.assert_called_once()
 
-#     def test_user_tasks(self):
-#         pass
+    @patch.object(ClickUpAdditionalMethods, "get_authorized_teams_workspaces")
+    def test_cached_teams_workspaces_expires_and_skips_errors(self, mock_request):
+        mock_request.return_value = {"teams": []}
+        self.api._cached_teams_workspaces(ttl=0)
+        self.api._cached_teams_workspaces(ttl=0)
+        mock_request.return_value = {"err": "Token invalid"}
+        self.api._cached_teams_workspaces(token="other")
+        self.api._cached_teams_workspaces(token="other")
+        self.assertEqual(mock_request.call_count, 4)
+
+    @patch.object(ClickUpAdditionalMethods, "get_authorized_teams_workspaces")
+    def test_cached_teams_workspaces_shares_concurrent_request(self, mock_request):
+        def slow_response(**kwargs):
+            time.sleep(0.05)
+            return {"teams": [{"id": "1", "members": []}]}
+
+        mock_request.side_effect = slow_response
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(lambda _: self.api._cached_teams_workspaces(), range(4))
+            )
+        self.assertEqual(results, [{"teams": [{"id": "1", "members": []}]}] * 4)
+        mock_request.assert_called_once()
+
+    @parameterized.expand(
+        [
+            ("list of team ids", [1, 2], [1, 2]),
+            ("tuple of team ids", (1, 2), [1, 2]),
+            ("empty list", [], []),
+        ]
+    )
+    @patch.object(ClickUpAdditionalMethods, "get_authorized_teams_workspaces")
+    def test_request_workspace_ids_given_team_id(
+        self, name: str, team_id: list | tuple, expected: list, mock_request
+    ):
+        self.assertEqual(self.api.request_workspace_ids(team_id=team_id), expected)
+        mock_request.assert_not_called()
+
+    @patch.object(ClickUpAdditionalMethods, "get_authorized_teams_workspaces")
+    def test_request_workspace_ids_all_teams(self, mock_request):
+        mock_request.return_value = {"teams": [{"id": "1"}, {"id": "2"}]}
+        self.assertEqual(self.api.request_workspace_ids(), ["1", "2"])
+
+    @parameterized.expand(
+        [
+            ("no teams for a token", None, {"teams": []}, ValueError),
+            ("error response", None, {"err": "Token invalid"}, ValueError),
+            ("invalid team_id type", 123, {"teams": []}, TypeError),
+        ]
+    )
+    @patch.object(ClickUpAdditionalMethods, "get_authorized_teams_workspaces")
+    def test_request_workspace_ids_raises_error(
+        self, name: str, team_id: Any, response: dict, error: Exception, mock_request
+    ):
+        mock_request.return_value = response
+        with self.assertRaises(error):
+            self.api.request_workspace_ids(team_id=team_id)
+
+    @patch.object(ClickUpAdditionalMethods, "get_time_entries")
+    def test_request_time_entries_for_workspace_ids_success(self, mock_request):
+        mock_request.side_effect = time_entries_response
+        responses = self.api.request_time_entries_for_workspace_ids(
+            [1, 2, 3], assignee=5
+        )
+        self.assertEqual(
+            [response["data"][0]["id"] for response in responses],
+            ["entry-1", "entry-2", "entry-3"],
+        )
+        self.assertEqual(mock_request.call_count, 3)
+        mock_request.assert_any_call(team_id=2, as_json=True, assignee=5)
+
+    @patch.object(ClickUpAdditionalMethods, "get_time_entries")
+    def test_request_time_entries_for_workspace_ids_inside_event_loop(
+        self, mock_request
+    ):
+        mock_request.side_effect = time_entries_response
+
+        async def request_from_coroutine():
+            return self.api.request_time_entries_for_workspace_ids([1, 2])
+
+        responses = asyncio.run(request_from_coroutine())
+        self.assertEqual(len(responses), 2)
+
+    @patch.object(ClickUpAdditionalMethods, "get_time_entries")
+    def test_request_time_entries_for_workspace_ids_raises_error(self, mock_request):
+        mock_request.side_effect = [{"data": []}, {"err": "Team not authorized"}]
+        with self.assertRaises(ReferenceError):
+            self.api.request_time_entries_for_workspace_ids([1, 2])
+
+    @patch("urllib3.util.retry.time.sleep")
+    @patch("urllib3.connectionpool.HTTPConnectionPool._make_request")
+    def test_time_entries_server_error_retried_only_by_adapter(
+        self, mock_request, mock_sleep
+    ):
+        mock_request.side_effect = lambda *args, **kwargs: HTTPResponse(
+            body=io.BytesIO(b'{"err": "Service unavailable"}'),
+            status=503,
+            headers={"Content-Type": "application/json"},
+            preload_content=False,
+        )
+        api = ClickUpAdditionalMethods(token="TokenRandomCode123", retry_total=5)
+        response = api._cached_time_entries(1)
+        self.assertEqual(response, {"err": "Service unavailable"})
+        self.assertEqual(mock_request.call_count, 6)
+
+    @parameterized.expand(
+        [
+            ("closed date range", (2020, 1, 31), 1),
+            ("open date range", None, 2),
+        ]
+    )
+    @patch.object(ClickUpAdditionalMethods, "get_time_entries")
+    def test_cached_time_entries_on_disk(
+        self, name: str, end_date: tuple | None, expected_calls: int, mock_request
+    ):
+        mock_request.side_effect = time_entries_response
+        with tempfile.TemporaryDirectory() as directory:
+            with patch.object(
+                ClickUpAdditionalMethods,
+                "TIME_ENTRIES_CACHE_PATH",
+                os.path.join(directory, "cache"),
+            ), patch.object(ClickUpAdditionalMethods, "TIME_ENTRIES_CACHE_TTL", -1):
+                first = self.api._cached_time_entries(1, end_date=end_date)
+                second = self.api._cached_time_entries(1, end_date=end_date)
+        self.assertEqual(first, second)
+        self.assertEqual(mock_request.call_count, expected_calls)
+
+    @patch.object(ClickUpAdditionalMethods, "TASKS_PAGE_SIZE", 2)
+    @patch.object(ClickUpAdditionalMethods, "get_tasks")
+    def test_get_all_tasks_merges_pages_in_order(self, mock_request):
+        pages = [["t1", "t2"], ["t3", "t4"], ["t5", "t6"], ["t7"]]
+        mock_request.side_effect = lambda list_id, page, **kwargs: {
+            "tasks": [{"id": task} for task in pages[page]] if page < len(pages) else []
+        }
+        tasks = self.api.get_all_tasks(5, archived=True)
+        self.assertEqual([task["id"] for task in tasks], [f"t{n}" for n in range(1, 8)])
+        mock_request.assert_any_call(5, page=0, archived=True)
+
+    @patch.object(ClickUpAdditionalMethods, "get_tasks")
+    def test_get_all_tasks_single_page(self, mock_request):
+        mock_request.return_value = {"tasks": [{"id": "t1"}], "last_page": True}
+        self.assertEqual(self.api.get_all_tasks(5), [{"id": "t1"}])
+        mock_request.assert_called_once()
+
+    @patch.object(ClickUpAdditionalMethods, "get_tasks")
+    def test_get_all_tasks_raises_error(self, mock_request):
+        mock_request.return_value = {"err": "List not found"}
+        with self.assertRaises(ReferenceError):
+            self.api.get_all_tasks(5)
+
+    @patch.object(ClickUpAdditionalMethods, "get_task_comments")
+    def test_get_task_comments_many_keeps_order(self, mock_request):
+        mock_request.side_effect = lambda task_id, **kwargs: {
+            "comments": [{"id": f"c-{task_id}"}]
+        }
+        responses = self.api.get_task_comments_many(["t1", "t2", "t3"], token="Tok")
+        self.assertEqual(
+            [response["comments"][0]["id"] for response in responses],
+            ["c-t1", "c-t2", "c-t3"],
+        )
+        mock_request.assert_any_call("t3", token="Tok")
+
+    @patch.object(ClickUpAdditionalMethods, "get_list_comments")
+    def test_get_list_comments_many_empty_list(self, mock_request):
+        self.assertEqual(self.api.get_list_comments_many([]), [])
+        mock_request.assert_not_called()
+
+    def test_is_closed_range(self):
+        recent = datetime.datetime.now() - datetime.timedelta(days=1)
+        self.assertTrue(self.api._is_closed_range([2020, 1, 31]))
+        self.assertFalse(self.api._is_closed_range(recent))
+        self.assertFalse(self.api._is_closed_range(None))
+
+    @parameterized.expand(
+        [
+            ("all time entries", False, {"Ann": "1:30:00", "Bob": "0:01:00"}),
+            ("only billable entries", True, {"Ann": "1:00:00", "Bob": "0:00:00"}),
+        ]
+    )
+    @patch.object(ClickUpAdditionalMethods, "get_time_entries")
+    def test_user_worktime_success(
+        self, name: str, only_billable: bool, expected: dict, mock_request
+    ):
+        mock_request.return_value = {
+            "data": [
+                {"user": {"username": "Ann"}, "duration": "3600000", "billable": True},
+                {"user": {"username": "Ann"}, "duration": "1800000", "billable": False},
+                {"user": {"username": "Bob"}, "duration": "60000", "billable": False},
+            ]
+        }
+        result = self.api.user_worktime(team_id=[1], only_billable=only_billable)
+        self.assertEqual(result, expected)
+
+    @patch.object(ClickUpAdditionalMethods, "get_time_entries")
+    @patch.object(ClickUpAdditionalMethods, "get_authorized_teams_workspaces")
+    def test_user_tasks_resolves_username_from_any_workspace(
+        self, mock_workspaces, mock_time_entries
+    ):
+        mock_workspaces.return_value = {
+            "teams": [
+                {"id": "1", "members": [{"user": {"id": 7, "username": "Ann Lee"}}]},
+                {"id": "2", "members": [{"user": {"id": 8, "username": "Bob"}}]},
+            ]
+        }
+        mock_time_entries.return_value = {"data": []}
+        result = self.api.user_tasks("ann lee")
+        self.assertEqual(result["user_id"], 7)
+        mock_workspaces.assert_called_once()
+
+    @patch.object(ClickUpAdditionalMethods, "get_time_entries")
+    @patch.object(ClickUpAdditionalMethods, "get_authorized_teams_workspaces")
+    def test_user_tasks_sums_duration_per_task(
+        self, mock_workspaces, mock_time_entries
+    ):
+        mock_workspaces.return_value = {
+            "teams": [{"id": "1", "members": [{"user": {"id": 7, "username": "Ann"}}]}]
+        }
+        task = {"id": "t1", "name": "Task", "custom_id": "C-1"}
+        mock_time_entries.return_value = {
+            "data": [
+                {"id": "e1", "task": task, "duration": "3600000"},
+                {"id": "e2", "task": task, "duration": "1800000"},
+                {
+                    "id": "e3",
+                    "task": {"id": "t2", "name": "Other"},
+                    "duration": "60000",
+                },
+            ]
+        }
+        result = self.api.user_tasks("Ann")
+        self.assertEqual(
+            [(t["task_id"], t["custom_id"], t["duration"]) for t in result["tasks"]],
+            [("t1", "C-1", "1:30:00"), ("t2", None, "0:01:00")],
+        )
+        self.assertEqual(
+            list(result["tasks"][0]), ["task_id", "custom_id", "task_name", "duration"]
+        )
+
+    @patch.object(ClickUpAdditionalMethods, "get_time_entries")
+    @patch.object(ClickUpAdditionalMethods, "get_authorized_teams_workspaces")
+    def test_user_tasks_entries_without_task(self, mock_workspaces, mock_time_entries):
+        mock_workspaces.return_value = {
+            "teams": [{"id": "1", "members": [{"user": {"id": 7, "username": "Ann"}}]}]
+        }
+        mock_time_entries.return_value = {
+            "data": [
+                {"id": "e1", "task": None, "duration": "60000"},
+                {"id": "e2", "custom_items": None, "duration": "60000"},
+            ]
+        }
+        result = self.api.user_tasks("Ann")
+        self.assertEqual(
+            result["tasks"],
+            [
+                {
+                    "task_id": None,
+                    "custom_id": None,
+                    "task_name": None,
+                    "duration": "0:02:00",
+                }
+            ],
+        )
+
+    @patch.object(ClickUpAdditionalMethods, "get_authorized_teams_workspaces")
+    def test_user_tasks_unknown_username_raises_error(self, mock_workspaces):
+        mock_workspaces.return_value = {"teams": [{"id": "1", "members": []}]}
+        with self.assertRaises(ValueError):
+            self.api.user_tasks("Ann Lee")
+
+    @parameterized.expand(
+        [
+            ("one by one", False),
+            ("concurrently", True),
+        ]
+    )
+    @patch.object(ClickUpAdditionalMethods, "create_checklist_item")
+    def test_add_items_to_a_checklist_success(
+        self, name: str, concurrent: bool, mock_request
+    ):
+        items = ["first", ("second", 7), ("third",)]
+        response = self.api.add_items_to_a_checklist(
+            "cl1", items, concurrent=concurrent
+        )
+        self.assertEqual(response["status_code"], 201)
+        self.assertEqual(
+            sorted(call.kwargs["name"] for call in mock_request.call_args_list),
+            ["first", "second", "third"],
+        )
+        mock_request.assert_any_call(
+            checklist_id="cl1", name="second", assignee=7, token=None
+        )
+
+    @patch.object(ClickUpAdditionalMethods, "add_items_to_a_checklist")
+    @patch.object(ClickUpAdditionalMethods, "create_checklist")
+    def test_post_checklist_with_many_items_success(self, mock_checklist, mock_items):
+        mock_checklist.return_value = {"checklist": {"id": "cl1"}}
+        self.api.post_checklist_with_many_items(
+            task_id="t1", checklist_name="New", checklist_items=["a"]
+        )
+        self.api.post_checklist_with_many_items(
+            checklist_id="cl2", checklist_items=["b"]
+        )
+        mock_checklist.assert_called_once_with("t1", "New", None)
+        self.assertEqual(
+            [call.args[0] for call in mock_items.call_args_list], ["cl1", "cl2"]
+        )
+
+    @parameterized.expand(
+        [
+            ("no ids", {}),
+            ("task_id and checklist_id", {"task_id": "t1", "checklist_id": "cl1"}),
+            ("task_id without name", {"task_id": "t1"}),
+            ("checklist_id with name", {"checklist_id": "cl1", "checklist_name": "N"}),
+            ("only checklist name", {"checklist_name": "N"}),
+        ]
+    )
+    def test_post_checklist_with_many_items_raises_error(self, name: str, kwargs: dict):
+        with self.assertRaises(AttributeError):
+            self.api.post_checklist_with_many_items(**kwargs)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,223 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import requests
+from dotenv import load_dotenv
+
+from clickup_api.exceptions import CircuitOpenError
+
+from ..delete_methods import ClickUpDELETEMethods
+
+load_dotenv()
+
+
+def delete_response(object_id: str, *args, **kwargs) -> dict:
+    return {"status code": 200, "message": {"deleted": object_id}}
+
+
+def http_response(status_code: int, content: bytes = b"") -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    return response
+
+
+class TestClickUpDELETEMethods(unittest.TestCase):
+
+    def setUp(self):
+        self.api = ClickUpDELETEMethods(token="TokenRandomCode123")
+
+    @patch.object(ClickUpDELETEMethods, "delete_task")
+    def test_bulk_delete_tasks_keeps_order(self, mock_request):
+        mock_request.side_effect = delete_response
+        responses = self.api.bulk_delete_tasks(["t1", "t2", "t3"], team_id=5)
+        self.assertEqual(
+            [response["message"]["deleted"] for response in responses],
+            ["t1", "t2", "t3"],
+        )
+        mock_request.assert_any_call("t2", False, 5, None)
+
+    @patch.object(ClickUpDELETEMethods, "delete_comment")
+    def test_bulk_delete_comments_success(self, mock_request):
+        mock_request.side_effect = delete_response
+        responses = self.api.bulk_delete_comments([1, 2])
+        self.assertEqual(len(responses), 2)
+        self.assertEqual(mock_request.call_count, 2)
+
+    @patch.object(ClickUpDELETEMethods, "delete_checklist")
+    def test_bulk_delete_by_kind(self, mock_request):
+        mock_request.side_effect = delete_response
+        responses = self.api.bulk_delete("checklist", ("cl1", "cl2"), token="Tok")
+        self.assertEqual(
+            [response["message"]["deleted"] for response in responses], ["cl1", "cl2"]
+        )
+        mock_request.assert_any_call("cl2", token="Tok")
+
+    def test_bulk_delete_invalid_kind_raises_error(self):
+        with self.assertRaises(ValueError):
+            self.api.bulk_delete("space", [1])
+
+    @patch.object(ClickUpDELETEMethods, "delete_task")
+    def test_bulk_delete_tasks_empty_list(self, mock_request):
+        self.assertEqual(self.api.bulk_delete_tasks([]), [])
+        mock_request.assert_not_called()
+
+    @patch("requests.Session.delete")
+    def test_delete_requests_have_timeout(self, mock_request):
+        mock_request.return_value = http_response(204)
+        self.api.delete_checklist("cl1")
+        self.assertEqual(
+            mock_request.call_args.kwargs["timeout"],
+            ClickUpDELETEMethods.REQUEST_TIMEOUT,
+        )
+
+    @patch("requests.Session.delete")
+    def test_delete_comment_returns_response_body(self, mock_request):
+        mock_request.return_value = http_response(404, b'{"err": "Not found"}')
+        self.assertEqual(
+            self.api.delete_comment(1),
+            {"status code": 404, "message": {"err": "Not found"}},
+        )
+
+    @patch("requests.Session.delete")
+    def test_delete_task_link_request(self, mock_request):
+        mock_request.return_value = http_response(200)
+        response = self.api.delete_task_link("t1", "t2", team_id=5)
+        self.assertEqual(response, {"status code": 200, "message": {}})
+        mock_request.assert_called_once()
+        self.assertEqual(
+            mock_request.call_args.args[0],
+            self.api.api_url + "task/t1/link/t2?custom_task_ids=true&team_id=5",
+        )
+        self.assertNotIn("params", mock_request.call_args.kwargs)
+        self.assertIs(mock_request.call_args.kwargs["headers"], self.api.header())
+        self.assertEqual(
+            mock_request.call_args.kwargs["headers"]["Content-Type"],
+            "application/json",
+        )
+
+    def test_bulkhead_bounds_concurrent_deletes(self):
+        api = ClickUpDELETEMethods(token="TokenRandomCode123", max_in_flight=2)
+        in_flight, peak = [0], [0]
+        lock = threading.Lock()
+
+        def slow_delete(*args, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return http_response(204)
+
+        with patch("requests.Session.delete", side_effect=slow_delete):
+            api.bulk_delete("comment", list(range(8)))
+        self.assertEqual(peak[0], 2)
+
+    @patch("requests.Session.delete")
+    def test_delete_task_dependency_skips_empty_query_values(self, mock_request):
+        mock_request.return_value = http_response(200)
+        self.api.delete_task_dependency("t1", depends_on="t 2")
+        self.assertEqual(
+            mock_request.call_args.args[0],
+            self.api.api_url
+            + "task/t1/dependency?depends_on=t+2&custom_task_ids=false",
+        )
+
+    @patch("requests.Session.delete")
+    def test_delete_task_replays_cached_response(self, mock_request):
+        mock_request.return_value = http_response(404, b'{"err": "Task not found"}')
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "deletes")
+            with patch.object(ClickUpDELETEMethods, "DELETE_CACHE_PATH", path):
+                first = self.api.delete_task("t1", cache=True)
+                second = self.api.delete_task("t1", cache=True)
+                self.api.delete_task("t1")
+        self.assertEqual(first, second)
+        self.assertEqual(mock_request.call_count, 2)
+
+    @patch("requests.Session.delete")
+    def test_delete_task_does_not_cache_server_errors(self, mock_request):
+        mock_request.return_value = http_response(500)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "deletes")
+            with patch.object(ClickUpDELETEMethods, "DELETE_CACHE_PATH", path):
+                self.api.delete_task("t1", cache=True)
+                self.api.delete_task("t1", cache=True)
+        self.assertEqual(mock_request.call_count, 2)
+
+    @patch("requests.Session.delete")
+    def test_circuit_opens_after_consecutive_failures(self, mock_request):
+        mock_request.return_value = http_response(503)
+        for _ in range(ClickUpDELETEMethods.CIRCUIT_FAILURE_THRESHOLD):
+            self.assertEqual(self.api.delete_comment(1)["status code"], 503)
+        with self.assertRaises(CircuitOpenError):
+            self.api.delete_comment(1)
+        self.assertEqual(
+            mock_request.call_count, ClickUpDELETEMethods.CIRCUIT_FAILURE_THRESHOLD
+        )
+
+    @patch("requests.Session.delete")
+    def test_circuit_counts_connection_errors(self, mock_request):
+        mock_request.side_effect = requests.ConnectionError()
+        for _ in range(ClickUpDELETEMethods.CIRCUIT_FAILURE_THRESHOLD):
+            with self.assertRaises(requests.ConnectionError):
+                self.api.delete_task("t1")
+        with self.assertRaises(CircuitOpenError):
+            self.api.delete_task("t1")
+
+    @patch("clickup_api_oop.circuit_breaker.time.monotonic")
+    @patch("requests.Session.delete")
+    def test_circuit_half_open_probe_closes_circuit(self, mock_request, mock_time):
+        mock_time.return_value = 1000
+        mock_request.return_value = http_response(500)
+        for _ in range(ClickUpDELETEMethods.CIRCUIT_FAILURE_THRESHOLD):
+            self.api.delete_comment(1)
+        mock_time.return_value += ClickUpDELETEMethods.CIRCUIT_RESET_TIMEOUT
+        mock_request.return_value = http_response(204)
+        self.assertEqual(self.api.delete_comment(1)["status code"], 204)
+        self.assertEqual(self.api.delete_comment(2)["status code"], 204)
+
+    @patch("requests.Session.delete")
+    def test_circuit_opens_on_outage_interleaved_with_other_errors(self, mock_request):
+        mock_request.side_effect = [
+            error
+            for _ in range(ClickUpDELETEMethods.CIRCUIT_FAILURE_THRESHOLD)
+            for error in (requests.exceptions.InvalidURL(), requests.ConnectionError())
+        ]
+        for _ in range(ClickUpDELETEMethods.CIRCUIT_FAILURE_THRESHOLD):
+            with self.assertRaises(requests.exceptions.InvalidURL):
+                self.api.delete_task("t1")
+            with self.assertRaises(requests.ConnectionError):
+                self.api.delete_task("t1")
+        with self.assertRaises(CircuitOpenError):
+            self.api.delete_task("t1")
+
+    @patch("clickup_api_oop.circuit_breaker.time.monotonic")
+    @patch("requests.Session.delete")
+    def test_circuit_half_open_probe_released_on_other_errors(
+        self, mock_request, mock_time
+    ):
+        mock_time.return_value = 1000
+        mock_request.return_value = http_response(500)
+        for _ in range(ClickUpDELETEMethods.CIRCUIT_FAILURE_THRESHOLD):
+            self.api.delete_comment(1)
+        mock_time.return_value += ClickUpDELETEMethods.CIRCUIT_RESET_TIMEOUT
+        mock_request.side_effect = [
+            requests.exceptions.InvalidURL(),
+            http_response(503),
+        ]
+        with self.assertRaises(requests.exceptions.InvalidURL):
+            self.api.delete_comment(1)
+        # the next request is a new probe - its failure opens the circuit again:
+        self.assertEqual(self.api.delete_comment(1)["status code"], 503)
+        with self.assertRaises(CircuitOpenError):
+            self.api.delete_comment(1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=1)
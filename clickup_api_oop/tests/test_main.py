@@ -1,10 +1,15 @@
+import datetime
 import unittest
 from typing import Any
 from unittest.mock import patch
 
+import requests
 from dotenv import load_dotenv
 from parameterized import parameterized
 
+from clickup_api.exceptions import CircuitOpenError
+
+from ..get_methods import ClickUpGETMethods
 from ..main import ClickUpAPI
 
 load_dotenv()
@@ -168,6 +173,185 @@ class TestClickUpAPICore(unittest.TestCase):
         with self.assertRaises(ValueError):
             ClickUpAPI.change_available_status(new_status, action)
 
+    def test_header_for_instance_token_is_reused_until_token_changes(self):
+        sample = ClickUpAPI("TokenRandomCode123")
+        self.assertIs(sample.header(), sample.header())
+        sample.token = "NewTokenCode456"
+        self.assertEqual(sample.header()["Authorization"], "NewTokenCode456")
+
+    def test_header_for_call_token_is_reused(self):
+        sample = ClickUpAPI("TokenRandomCode123")
+        self.assertIs(sample.header(token="ABCD1234"), sample.header(token="ABCD1234"))
+        self.assertEqual(
+            sample.header(content_type="text/plain", token="ABCD1234")["Content-Type"],
+            "text/plain",
+        )
+        with self.assertRaises(TypeError):
+            sample.header(token=1234)
+
+    def test_session_is_shared_by_get_requests(self):
+        sample = ClickUpGETMethods("TokenRandomCode123")
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"user": {"id": 1}}'
+        with patch.object(sample.session, "get", return_value=response) as mock_get:
+            self.assertEqual(sample.get_authorized_user(), {"user": {"id": 1}})
+            self.assertEqual(sample.get_teams(), {"user": {"id": 1}})
+        self.assertEqual(mock_get.call_count, 2)
+
+    def test_get_tasks_query_skips_empty_filters(self):
+        sample = ClickUpGETMethods("TokenRandomCode123")
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"tasks": []}'
+        with patch.object(sample.session, "get", return_value=response) as mock_get:
+            sample.get_tasks(5, archived=True, due_date_gt=1714521600000)
+        self.assertEqual(
+            mock_get.call_args.kwargs["params"],
+            {
+                "page": 0,
+                "order_by": "created",
+                "archived": "true",
+                "include_markdown_description": "false",
+                "reverse": "false",
+                "include_closed": "false",
+                "due_date_gt": 1714521600000,
+            },
+        )
+
+    def test_get_task_query_skips_none_values(self):
+        sample = ClickUpGETMethods("TokenRandomCode123")
+        response = requests.Response()
+        response.status_code = 200
+        with patch.object(sample.session, "get", return_value=response) as mock_get:
+            sample.get_task("abc", as_json=False)
+        self.assertNotIn("team_id", mock_get.call_args.kwargs["params"])
+        self.assertEqual(
+            mock_get.call_args.kwargs["params"]["custom_task_ids"], "false"
+        )
+
+    def test_get_time_entries_defaults_to_current_month(self):
+        sample = ClickUpGETMethods("TokenRandomCode123")
+        response = requests.Response()
+        response.status_code = 200
+        today = datetime.date.today()
+        month_start = datetime.datetime(today.year, today.month, 1).timestamp()
+        with patch.object(sample.session, "get", return_value=response) as mock_get:
+            sample.get_time_entries(1, as_json=False)
+        self.assertEqual(
+            mock_get.call_args.kwargs["params"]["start_date"], int(month_start * 1000)
+        )
+
+    @parameterized.expand(
+        [
+            ("single user", 7, "7"),
+            ("list of users", [7, 8, 9], "7,8,9"),
+            ("tuple of users", (7, 8), "7,8"),
+        ]
+    )
+    def test_get_time_entries_joins_assignee_ids(
+        self, name: str, assignee: Any, expected: str
+    ):
+        sample = ClickUpGETMethods("TokenRandomCode123")
+        response = requests.Response()
+        response.status_code = 200
+        with patch.object(sample.session, "get", return_value=response) as mock_get:
+            sample.get_time_entries(1, assignee=assignee, as_json=False)
+        self.assertEqual(mock_get.call_args.kwargs["params"]["assignee"], expected)
+
+    @parameterized.expand(
+        [
+            ("task", "get_task_comments", "abc", "task/abc/comment"),
+            ("list", "get_list_comments", 5, "list/5/comment"),
+            ("view", "get_chat_view_comments", "v1", "view/v1/comment"),
+        ]
+    )
+    def test_comment_getters_share_request_building(
+        self, name: str, method: str, obj_id: Any, path: str
+    ):
+        sample = ClickUpGETMethods("TokenRandomCode123")
+        response = requests.Response()
+        response.status_code = 200
+        start = datetime.datetime(2024, 5, 1)
+        with patch.object(sample.session, "get", return_value=response) as mock_get:
+            getattr(sample, method)(obj_id, start=start, start_id="9", as_json=False)
+        self.assertEqual(mock_get.call_args.args[0], sample.api_url + path)
+        params = mock_get.call_args.kwargs["params"]
+        self.assertEqual(params["start"], int(start.timestamp() * 1000))
+        self.assertEqual(params["start_id"], "9")
+        self.assertEqual("custom_task_ids" in params, name == "task")
+
+    def test_get_tasks_streams_response_on_request(self):
+        sample = ClickUpGETMethods("TokenRandomCode123")
+        response = requests.Response()
+        response.status_code = 200
+        with patch.object(sample.session, "get", return_value=response) as mock_get:
+            self.assertIs(sample.get_tasks(5, as_json=False, stream=True), response)
+            sample.get_tasks(5, as_json=False)
+        self.assertTrue(mock_get.call_args_list[0].kwargs["stream"])
+        self.assertFalse(mock_get.call_args_list[1].kwargs["stream"])
+
+    @parameterized.expand(
+        [
+            ("not allowed field", "name", ValueError),
+            ("not a string", ["id"], TypeError),
+        ]
+    )
+    def test_get_tasks_invalid_order_by_raises_error(
+        self, name: str, order_by: Any, error: Exception
+    ):
+        sample = ClickUpGETMethods("TokenRandomCode123")
+        with patch.object(sample.session, "get") as mock_get:
+            with self.assertRaises(error):
+                sample.get_tasks(5, order_by=order_by)
+        mock_get.assert_not_called()
+
+    def test_circuit_breaker_fails_fast_on_get_requests(self):
+        sample = ClickUpGETMethods("TokenRandomCode123")
+        with patch.object(
+            sample.session, "get", side_effect=requests.Timeout()
+        ) as mock_get:
+            for _ in range(ClickUpAPI.CIRCUIT_FAILURE_THRESHOLD):
+                with self.assertRaises(requests.Timeout):
+                    sample.get_task("abc")
+            with self.assertRaises(CircuitOpenError):
+                sample.get_task("abc")
+        self.assertEqual(mock_get.call_count, ClickUpAPI.CIRCUIT_FAILURE_THRESHOLD)
+
+    def test_session_requests_compressed_responses(self):
+        sample = ClickUpAPI("TokenRandomCode123")
+        request = sample.session.prepare_request(
+            requests.Request("GET", sample.api_url + "team", headers=sample.header())
+        )
+        self.assertIn("gzip", request.headers["Accept-Encoding"])
+        self.assertEqual(request.headers["Authorization"], "TokenRandomCode123")
+
+    def test_context_manager_closes_session(self):
+        with patch.object(requests.Session, "close") as mock_close:
+            with ClickUpAPI("TokenRandomCode123") as sample:
+                self.assertIsInstance(sample, ClickUpAPI)
+            mock_close.assert_called_once()
+
+    def test_session_retries_transient_errors(self):
+        sample = ClickUpAPI("TokenRandomCode123", retry_total=3, backoff_factor=0.5)
+        retry = sample._session.get_adapter(sample._API_DEFAULT_URL).max_retries
+        self.assertEqual(retry.total, 3)
+        self.assertEqual(retry.backoff_factor, 0.5)
+        self.assertTrue(retry.is_retry("DELETE", 503))
+        self.assertTrue(retry.is_retry("DELETE", 429, has_retry_after=True))
+        self.assertTrue(retry.is_retry("GET", 502))
+        self.assertFalse(retry.is_retry("DELETE", 404))
+        self.assertFalse(retry.is_retry("POST", 503))
+        self.assertEqual(retry.backoff_max, ClickUpAPI.RETRY_BACKOFF_MAX)
+
+    def test_response_json_decodes_response_body(self):
+        response = requests.Response()
+        response._content = b'{"data": [{"id": "1", "duration": "60000"}]}'
+        self.assertEqual(
+            ClickUpAPI.response_json(response),
+            {"data": [{"id": "1", "duration": "60000"}]},
+        )
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=1)